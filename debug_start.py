@@ -5,16 +5,23 @@ Debug startup script for Plex Discord Announcer.
 
 import logging
 import os
+import re
+import subprocess
 import sys
-import time
 from datetime import datetime
 
+DEBUG_LOG_FILE = "debug_log.txt"
+
+# Start with an empty log, then append: the bot process writes to the same file, and
+# append mode keeps either process from writing over the other's output
+open(DEBUG_LOG_FILE, "w").close()
+
 # Configure direct logging to file
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    filename="debug_log.txt",
-    filemode="w",
+    filename=DEBUG_LOG_FILE,
+    filemode="a",
 )
 
 console = logging.StreamHandler()
@@ -23,40 +30,33 @@ logging.getLogger("").addHandler(console)
 
 logger = logging.getLogger("debug_startup")
 
+# Environment variable names containing any of these are never logged
+SENSITIVE_KEY_PATTERN = re.compile("TOKEN|SECRET|KEY")
+
 
 def main():
     """Debug startup function."""
     logger.info("Starting debug script at %s", datetime.now())
 
-    # Log environment variables (except sensitive ones)
-    logger.info("Environment variables:")
-    for key, value in os.environ.items():
-        if any(sensitive in key for sensitive in ["TOKEN", "SECRET", "KEY"]):
-            logger.info("%s: [REDACTED]", key)
-        else:
-            logger.info("%s: %s", key, value)
+    # Log environment variables (except sensitive ones) as a single record
+    env_lines = "\n".join(
+        f"{key}: {'[REDACTED]' if SENSITIVE_KEY_PATTERN.search(key) else value}"
+        for key, value in os.environ.items()
+    )
+    logger.info("Environment variables:\n%s", env_lines)
 
-    # Start the actual bot in the background
+    # Start the actual bot in a separate process
     logger.info("Starting bot process...")
-    if os.fork() == 0:  # Child process
-        # Execute the real bot
-        try:
-            import asyncio
-
-            from plex_announcer.cli import main as cli_main
-
-            logger.info("Executing main function from plex_announcer.cli")
-            asyncio.run(cli_main())
-        except Exception as e:
-            logger.error("Failed to start bot: %s", e, exc_info=True)
-            sys.exit(1)
-    else:  # Parent process
-        logger.info("Bot started in background. Parent process will exit successfully.")
-
-        # Sleep briefly to allow child process to start
-        time.sleep(3)
-        logger.info("Parent process exiting successfully")
-        return 0
+    with open(DEBUG_LOG_FILE, "a") as log_file:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "plex_announcer"],
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    logger.info("Bot started in background with PID %s. Parent process exiting.", process.pid)
+    return 0
 
 
 if __name__ == "__main__":
@@ -1,3 +1,3 @@
 """Discord bot for Plex media server announcements."""
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
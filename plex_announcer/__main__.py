@@ -0,0 +1,5 @@
+"""Allow running the announcer with ``python -m plex_announcer``."""
+
+from plex_announcer.cli import run
+
+run()
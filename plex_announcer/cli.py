@@ -2,49 +2,167 @@
 Command-line interface for Plex Discord Announcer.
 """
 
+import argparse
 import asyncio
+import functools
 import logging
+import os
 import signal
+import socket
 import sys
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
 
-from dotenv import load_dotenv
-
-from plex_announcer.core.discord_bot import PlexDiscordBot
-from plex_announcer.core.plex_monitor import PlexMonitor
+from plex_announcer import __version__
 from plex_announcer.utils.config import Config
 from plex_announcer.utils.logging_config import configure_logging
 
 logger = logging.getLogger("plex_discord_bot")
 
+# Seconds allowed for logging in to Discord before giving up
+STARTUP_TIMEOUT = 60
+
+# Signals that trigger a clean shutdown
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
 
-def signal_handler(sig, frame):
-    """Handle termination signals for clean shutdown."""
+
+def _shutdown(task: asyncio.Task) -> None:
+    """Handle termination signals by cancelling the main task for a clean shutdown."""
     logger.info("Received termination signal, shutting down...")
-    sys.exit(0)
+    # Restore default handling, so a second signal stops a shutdown that hangs
+    loop = task.get_loop()
+    for sig in SHUTDOWN_SIGNALS:
+        loop.remove_signal_handler(sig)
+    task.cancel()
+
+
+def install_signal_handlers() -> None:
+    """Route SIGINT and SIGTERM through the running event loop."""
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    for sig in SHUTDOWN_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, _shutdown, task)
+        except NotImplementedError:
+            # Windows loops have no signal hooks; Ctrl-C still raises KeyboardInterrupt there
+            pass
+
+
+def _run_in_daemon_thread(func) -> "asyncio.Future":
+    """Run a blocking call in a daemon thread, which shutdown does not wait for.
+
+    The default executor is joined when the event loop closes, so a signal during a slow
+    blocking call would otherwise only take effect once that call returns.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result, error) -> None:
+        # The awaiting task may have been cancelled in the meantime
+        if future.done():
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def target() -> None:
+        result, error = None, None
+        try:
+            result = func()
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # The event loop already closed during shutdown
+            pass
+
+    threading.Thread(target=target, name=getattr(func, "__name__", None), daemon=True).start()
+    return future
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments before anything heavy is imported."""
+    parser = argparse.ArgumentParser(
+        prog="plex-announcer",
+        description="Announce new Plex media in Discord. "
+        "Settings are read from environment variables or a .env file.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return parser.parse_args(argv)
+
+
+def load_env() -> None:
+    """Load variables from ./.env unless disabled or the environment is already complete."""
+    if os.environ.get("DOTENV_DISABLE") == "1":
+        return
+
+    # Docker and systemd usually export everything already; skip reading the file then
+    if all(os.environ.get(key) for key in Config.REQUIRED_KEYS):
+        return
+
+    from dotenv import load_dotenv
+
+    # An explicit path avoids python-dotenv walking up the directory tree
+    load_dotenv(dotenv_path=Path.cwd() / ".env", override=False)
+
+
+async def plex_host_resolves(base_url: str) -> bool:
+    """Return True if the host name in the Plex URL resolves in DNS."""
+    host = urlparse(base_url).hostname
+    if not host:
+        return False
+    try:
+        await asyncio.get_running_loop().getaddrinfo(host, None)
+    except socket.gaierror:
+        return False
+    return True
 
 
 async def main():
     """Run the Plex Discord bot."""
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Install signal handlers before any slow work so Ctrl-C works during Plex retries
+    install_signal_handlers()
 
+    # Configuration errors already carry a clear message, so skip the traceback
     try:
-        # Load config
-        load_dotenv()
+        load_env()
         config = Config.from_env()
+    except ValueError as e:
+        logger.error("Config error: %s", e)
+        sys.exit(2)
 
+    try:
         # Configure logging
         configure_logging(log_file="plex_discord_bot.log")
 
-        # Connect to Plex server with timeout
-        logger.info(f"Connecting to Plex server at {config.plex_base_url}")
-        plex_monitor = PlexMonitor(
-            base_url=config.plex_base_url,
-            token=config.plex_token,
-            movie_library=config.movie_library,
-            tv_library=config.tv_library,
-            connect_retry=config.plex_connect_retry,
+        # discord.py and plexapi are slow to import, so only load them once config is valid
+        from plex_announcer.core.discord_bot import PlexDiscordBot
+        from plex_announcer.core.plex_monitor import PlexMonitor
+
+        # Retrying is pointless when the Plex host name does not even resolve
+        connect_retry = config.plex_connect_retry
+        if not await plex_host_resolves(config.plex_base_url):
+            logger.warning(
+                "Could not resolve the host in %s, skipping Plex connection retries",
+                config.plex_base_url,
+            )
+            connect_retry = 0
+
+        # Connect in a daemon thread so the event loop keeps handling signals and a shutdown
+        # doesn't wait for the connection retries to finish
+        logger.info("Connecting to Plex server at %s", config.plex_base_url)
+        plex_monitor = await _run_in_daemon_thread(
+            functools.partial(
+                PlexMonitor,
+                base_url=config.plex_base_url,
+                token=config.plex_token,
+                movie_library=config.movie_library,
+                tv_library=config.tv_library,
+                connect_retry=connect_retry,
+            ),
         )
 
         if not plex_monitor.plex:
@@ -54,44 +172,58 @@ async def main():
             # Continue execution, don't exit
 
         # Set up Discord bot
-        logger.info("Setting up Discord bot")
-        logger.info(f"Movie channel ID: {config.movie_channel_id}")
-        logger.info(f"New shows channel ID: {config.new_shows_channel_id}")
-        logger.info(f"Recent episodes channel ID: {config.recent_episodes_channel_id}")
-        logger.info(f"Bot debug channel ID: {config.bot_debug_channel_id}")
-
-        bot = PlexDiscordBot(
-            token=config.discord_token,
-            plex_monitor=plex_monitor,
-            movie_channel_id=config.movie_channel_id,
-            new_shows_channel_id=config.new_shows_channel_id,
-            recent_episodes_channel_id=config.recent_episodes_channel_id,
-            bot_debug_channel_id=config.bot_debug_channel_id,
-            movie_library=config.movie_library,
-            tv_library=config.tv_library,
-            notify_movies=config.notify_movies,
-            notify_new_shows=config.notify_new_shows,
-            notify_recent_episodes=config.notify_recent_episodes,
-            recent_episode_days=config.recent_episode_days,
-            check_interval=config.check_interval,
-            webhook_enabled=config.webhook_enabled,
-            webhook_port=config.webhook_port,
-            webhook_host=config.webhook_host,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Setting up Discord bot")
+            logger.info("Movie channel ID: %s", config.movie_channel_id)
+            logger.info("New shows channel ID: %s", config.new_shows_channel_id)
+            logger.info("Recent episodes channel ID: %s", config.recent_episodes_channel_id)
+            logger.info("Bot debug channel ID: %s", config.bot_debug_channel_id)
+
+        bot = PlexDiscordBot(config, plex_monitor)
 
         logger.info("Starting Discord bot")
 
-        # Run with a timeout to prevent hanging
+        # Bound only the Discord handshake; once ready the bot runs until shutdown
+        bot_task = asyncio.ensure_future(bot.run())
+        ready_task = asyncio.ensure_future(bot.ready_event.wait())
         try:
-            await asyncio.wait_for(bot.run(), timeout=60)
-        except asyncio.TimeoutError:
-            logger.error("Bot startup timed out after 60 seconds. Exiting.")
-            sys.exit(1)
-
-    except Exception as e:
-        logger.error(f"Unhandled exception: {e}", exc_info=True)
+            done, _ = await asyncio.wait(
+                {bot_task, ready_task},
+                timeout=STARTUP_TIMEOUT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                logger.error("Bot startup timed out after %s seconds. Exiting.", STARTUP_TIMEOUT)
+                sys.exit(1)
+            await bot_task
+        finally:
+            ready_task.cancel()
+            if not bot_task.done():
+                bot_task.cancel()
+                await asyncio.gather(bot_task, return_exceptions=True)
+
+    except asyncio.CancelledError:
+        logger.info("Shutdown complete")
+    except Exception:
+        logger.exception("Unhandled exception")
         sys.exit(1)
 
 
-if __name__ == "__main__":
+def run():
+    """Synchronous entry point used by ``python -m plex_announcer`` and console scripts."""
+    # --help and --version exit here, before the event loop or any heavy import
+    parse_args()
+
+    # uvloop is optional (it is not available on Windows); fall back to the default loop
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run()
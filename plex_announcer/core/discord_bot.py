@@ -3,70 +3,260 @@ Discord bot implementation for sending Plex media notifications.
 """
 
 import asyncio
+import functools
+import io
+import itertools
 import logging
 import os
 import time
-from datetime import datetime
-from typing import Optional
+from collections import ChainMap, OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+import aiohttp
 import discord
-from discord.ext import commands, tasks
+from discord import app_commands
+from discord.utils import utcnow
 
+from plex_announcer.utils.config import Config
 from plex_announcer.utils.embed_builder import EmbedBuilder
-from plex_announcer.utils.media_storage import load_last_check_time, save_last_check_time
+from plex_announcer.utils.media_storage import (
+    append_processed_media,
+    load_processed_media,
+    save_processed_media,
+)
 
 logger = logging.getLogger("plex_discord_bot")
 
+# Discord accepts at most ten embeds in a single message
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# Minimum seconds between messages to one channel, keeping under Discord's 5 per 5 seconds
+CHANNEL_SEND_INTERVAL = 1.0
+
+# Seconds to wait before writing processed media, so bursts share one write
+PROCESSED_MEDIA_FLUSH_DELAY = 5
+
+# Keys appended to the processed media log before it is folded back into the saved file
+PROCESSED_MEDIA_COMPACT_AFTER = 1_000
+
+# Seconds to collect episode announcements before sending them together
+EPISODE_BATCH_WINDOW = 3
+
+# Seconds allowed at shutdown for sending episodes that are still queued
+EPISODE_SHUTDOWN_TIMEOUT = 5
+
+# Number of announced rating keys remembered; the oldest are forgotten first
+MAX_PROCESSED_MEDIA = 10_000
+
+# Seconds a recently added media lookup is reused, so reconnect storms don't hammer Plex
+RECENT_MEDIA_TTL = 60
+
+# Seconds a Plex connection check is reused, so repeated /healthcheck calls don't reconnect
+PLEX_CONNECT_CHECK_TTL = 10
+
+# Seconds allowed for downloading artwork from Plex before posting without it
+POSTER_FETCH_TIMEOUT = 10
+
+# Size Plex scales artwork to before upload; plenty for an embed thumbnail
+POSTER_WIDTH = 300
+POSTER_HEIGHT = 450
+
+# Maximum number of artwork downloads from Plex in flight at once
+MAX_CONCURRENT_PLEX_FETCHES = 4
+
+# Seconds an announced title is remembered, so a metadata refresh under a new rating key
+# doesn't announce the same item again
+ANNOUNCE_COOLDOWN = 60
+
+# Number of recently announced titles remembered for the cooldown
+MAX_RECENT_ANNOUNCEMENTS = 512
+
+# Fallback values for webhook metadata fields Plex leaves out
+_MOVIE_DEFAULTS = {
+    "title": "Unknown Title",
+    "summary": "No summary available",
+    # Left out of the title when missing, rather than rendering "(Unknown Year)"
+    "year": None,
+    "tagline": "",
+    "thumb": "",
+    "art": "",
+    "duration": 0,
+    "rating": 0.0,
+}
+_EPISODE_DEFAULTS = {
+    "title": "Unknown Title",
+    "summary": "No summary available",
+    "parentIndex": 0,
+    "index": 0,
+    "grandparentTitle": "Unknown Show",
+    "thumb": "",
+    "art": "",
+    "grandparentThumb": "",
+    "duration": 0,
+}
+_SHOW_DEFAULTS = {
+    "title": "Unknown Title",
+    "summary": "No summary available",
+    "year": None,
+    "thumb": "",
+    "art": "",
+}
+
+# Webhook fields that tell episodes apart by title, for the announcement cooldown
+_EPISODE_IDENTITY = ("grandparentTitle", "parentIndex", "index")
+
+
+class AnnouncerClient(discord.Client):
+    """Discord client that registers the announcer's slash commands on login."""
+
+    def __init__(self, **kwargs):
+        """Create the client and its slash command tree; kwargs go to discord.Client."""
+        super().__init__(**kwargs)
+        self.tree = app_commands.CommandTree(self)
+
+    async def setup_hook(self) -> None:
+        """Sync the slash commands with Discord once per login."""
+        try:
+            synced = await self.tree.sync()
+        except discord.HTTPException as e:
+            # Commands synced by an earlier login keep working, so don't fail the login over it
+            logger.warning("Could not sync slash commands: %s", e)
+            return
+        logger.info("Synced %s slash commands", len(synced))
+
 
 class PlexDiscordBot:
     """Discord bot for announcing new Plex media."""
 
-    def __init__(
-        self,
-        token: str,
-        plex_monitor,
-        movie_channel_id: int,
-        new_shows_channel_id: int,
-        recent_episodes_channel_id: int,
-        bot_debug_channel_id: int = None,
-        movie_library: str = "Movies",
-        tv_library: str = "TV Shows",
-        notify_movies: bool = True,
-        notify_new_shows: bool = True,
-        notify_recent_episodes: bool = True,
-        recent_episode_days: int = 30,
-        webhook_enabled: bool = False,
-        webhook_port: int = 10000,
-        webhook_host: str = "0.0.0.0",
-    ):
-        """Initialize the Discord bot."""
-        self.token = token
-        self.movie_channel_id = movie_channel_id  # Channel for movie announcements
-        self.new_shows_channel_id = new_shows_channel_id  # Channel for new show announcements
-        self.recent_episodes_channel_id = (
-            recent_episodes_channel_id  # Channel for recent episode announcements
-        )
-        self.bot_debug_channel_id = bot_debug_channel_id  # Channel to show bot presence in
+    # Fixed attribute layout; add new instance attributes here too
+    __slots__ = (
+        "config",
+        "plex_monitor",
+        "webhook_server",
+        "processed_media",
+        "_flush_task",
+        "_unsaved_media",
+        "_logged_media_count",
+        "_needs_compaction",
+        "_recent_announcements",
+        "_specialized_channels",
+        "_channel_cache",
+        "_webhooks",
+        "_channel_send_locks",
+        "_channel_last_send",
+        "_status_embed",
+        "_episode_queue",
+        "_episode_drain_task",
+        "_http_session",
+        "_plex_fetch_semaphore",
+        "_poster_ids",
+        "_recent_media",
+        "_recent_media_expires",
+        "_plex_connected",
+        "_plex_connected_expires",
+        "last_connected",
+        "_startup_announced",
+        "_watching_activity",
+        "bot",
+        "tree",
+        "start_time",
+        "ready_event",
+        "_announce_dispatch",
+        "_enabled_media_types",
+    )
+
+    def __init__(self, config: Config, plex_monitor):
+        """
+        Initialize the Discord bot.
+
+        Args:
+            config (Config): Parsed application settings.
+            plex_monitor (PlexMonitor): Connection to the Plex server.
+        """
+        self.config = config
         self.plex_monitor = plex_monitor
-        self.movie_library = movie_library
-        self.tv_library = tv_library
-        self.notify_movies = notify_movies
-        self.notify_new_shows = notify_new_shows
-        self.notify_recent_episodes = notify_recent_episodes
-        self.recent_episode_days = recent_episode_days
-        self.webhook_enabled = webhook_enabled
-        self.webhook_port = webhook_port
-        self.webhook_host = webhook_host
         self.webhook_server = None
 
+        # Rating keys of media that has already been announced
+        self.processed_media = load_processed_media(config.data_file, MAX_PROCESSED_MEDIA)
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Keys marked since the last write, and whether the next write must save everything
+        # because a key already in the log was forgotten
+        self._unsaved_media: Dict[int, None] = {}
+        self._logged_media_count = 0
+        self._needs_compaction = False
+
+        # When each recently announced title was claimed, oldest first
+        self._recent_announcements: "OrderedDict[tuple, float]" = OrderedDict()
+
+        # Announcement channels as (channel ID, label), shared by the startup check and /status
+        self._specialized_channels: Tuple[Tuple[int, str], ...] = (
+            (config.movie_channel_id, "Movie"),
+            (config.new_shows_channel_id, "New Shows"),
+            (config.recent_episodes_channel_id, "Recent Episodes"),
+        )
+
+        # Resolved announcement channels, keyed by channel ID
+        self._channel_cache: Dict[int, discord.abc.Messageable] = {}
+
+        # Discord webhooks for announcements, keyed by URL
+        self._webhooks: Dict[str, discord.Webhook] = {}
+
+        # Per-channel send locks and when each channel was last sent to, for pacing bursts
+        self._channel_send_locks: Dict[int, asyncio.Lock] = {}
+        self._channel_last_send: Dict[int, float] = {}
+
+        # /status embed without uptime, rebuilt whenever cached channels are dropped
+        self._status_embed: Optional[discord.Embed] = None
+
+        # Episode announcements waiting to be sent together, and the task sending them
+        self._episode_queue: asyncio.Queue = asyncio.Queue()
+        self._episode_drain_task: Optional[asyncio.Task] = None
+
+        # HTTP session for downloading artwork from Plex, created on first use
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._plex_fetch_semaphore: Optional[asyncio.Semaphore] = None
+        # Numbers attachments of items that have no rating key
+        self._poster_ids = itertools.count(1)
+
+        # Recently added (movies, episodes) used for the presence, refreshed after the TTL
+        self._recent_media: Optional[Tuple[list, list]] = None
+        self._recent_media_expires = 0.0
+
+        # Result of the last Plex connection check, reused until it expires
+        self._plex_connected = False
+        self._plex_connected_expires = 0.0
+
         # Internal state
         self.last_connected = False
-        self.bot = commands.Bot(command_prefix="/", intents=discord.Intents.default())
+        self._startup_announced = False
+        self._watching_activity = discord.Activity(type=discord.ActivityType.watching, name="")
+        # Only slash commands are used, so a plain client skips prefix parsing of every message
+        self.bot = AnnouncerClient(intents=discord.Intents.default())
+        self.tree = self.bot.tree
         self.start_time = time.time()
 
-        # Set up Discord bot
-        intents = discord.Intents.default()
-        intents.message_content = True
+        # Set once the Discord gateway handshake has completed
+        self.ready_event = asyncio.Event()
+
+        # Announcement handler for each Plex media type
+        self._announce_dispatch = {
+            "movie": self.announce_new_movie_from_webhook,
+            "episode": self.announce_new_episode_from_webhook,
+            "show": self.announce_new_show_from_webhook,
+        }
+
+        # Media types whose notifications are switched on
+        self._enabled_media_types = frozenset(
+            media_type
+            for media_type, enabled in (
+                ("movie", config.notify_movies),
+                ("episode", config.notify_recent_episodes),
+                ("show", config.notify_new_shows),
+            )
+            if enabled
+        )
 
         # Register commands and events
         self._setup_bot()
@@ -77,19 +267,20 @@ class PlexDiscordBot:
         @self.bot.event
         async def on_ready():
             """Handle the bot ready event."""
-            logger.info(f"Logged in as {self.bot.user.name} ({self.bot.user.id})")
-            logger.info(f"Connected to {len(self.bot.guilds)} guilds")
+            self.ready_event.set()
+            logger.info("Logged in as %s (%s)", self.bot.user.name, self.bot.user.id)
+            logger.info("Connected to %d guilds", len(self.bot.guilds))
 
             # Debug: List all guilds and channels
-            for guild in self.bot.guilds:
-                logger.info(f"Guild: {guild.name} (ID: {guild.id})")
-                logger.info(f"Channels in {guild.name}:")
-                for channel in guild.channels:
-                    if isinstance(channel, discord.TextChannel):
-                        logger.info(f"  - #{channel.name} (ID: {channel.id})")
+            if logger.isEnabledFor(logging.DEBUG):
+                for guild in self.bot.guilds:
+                    logger.debug("Guild: %s (ID: %s)", guild.name, guild.id)
+                    logger.debug("Channels in %s:", guild.name)
+                    for channel in guild.text_channels:
+                        logger.debug("  - #%s (ID: %s)", channel.name, channel.id)
 
             # Set bot presence based on recent media
-            debug_channel = self.bot.get_channel(self.bot_debug_channel_id)
+            debug_channel = await self._get_channel(self.config.bot_debug_channel_id)
 
             # Try to get recent movies
             try:
@@ -98,103 +289,109 @@ class PlexDiscordBot:
                     logger.warning("Plex server not connected, using default activity")
                     activity_name = "for Plex to connect..."
                 else:
-                    recent_movies = self.plex_monitor.get_recently_added_movies(days=7)
-                    recent_episodes = self.plex_monitor.get_recently_added_episodes(days=7)
+                    recent_movies, recent_episodes = await self._get_recent_media()
 
                     if recent_movies and len(recent_movies) > 0:
                         # Use the most recent movie for presence
                         latest_movie = recent_movies[0]
                         movie_title = latest_movie.get("title", "a movie")
                         activity_name = f"📽️ {movie_title}"
-                        logger.info(f"Setting activity to recent movie: {movie_title}")
+                        logger.info("Setting activity to recent movie: %s", movie_title)
                     elif recent_episodes and len(recent_episodes) > 0:
                         # Use the most recent show for presence
                         latest_episode = recent_episodes[0]
                         show_title = latest_episode.get("show_title", "a show")
                         activity_name = f"📺 {show_title}"
-                        logger.info(f"Setting activity to recent show: {show_title}")
+                        logger.info("Setting activity to recent show: %s", show_title)
                     else:
                         # Default presence when no recent media
                         activity_name = "for new movies..."
                         logger.info("No recent media found, setting default activity")
             except Exception as e:
-                logger.error(f"Error setting activity status: {e}")
+                logger.error("Error setting activity status: %s", e)
                 # Default presence on error
-                await self.bot.change_presence(
-                    activity=discord.Activity(
-                        type=discord.ActivityType.watching, name="Plex for new media"
-                    )
-                )
-                return
+                activity_name = "Plex for new media"
 
-            # Set the activity
-            await self.bot.change_presence(
-                activity=discord.Activity(type=discord.ActivityType.watching, name=activity_name)
-            )
+            # Set the activity, reusing one Activity across reconnects
+            self._watching_activity.name = activity_name
+            await self.bot.change_presence(activity=self._watching_activity)
 
             if debug_channel:
-                logger.info(f"Debug channel found: #{debug_channel.name}")
+                logger.info("Debug channel found: #%s", debug_channel.name)
             else:
-                logger.warning(f"Debug channel ID {self.bot_debug_channel_id} not found")
+                logger.warning("Debug channel ID %s not found", self.config.bot_debug_channel_id)
 
-            # Find default channel and send startup message
-            debug_channel = self.bot.get_channel(self.bot_debug_channel_id)
-            if debug_channel:
-                logger.info(f"Found bot debug channel: #{debug_channel.name}")
+            # Check for specialized channels, collecting any that are missing for the startup
+            # message
+            missing_channels = await self._verify_channels()
 
-                # Send startup message
+            # Send the startup message to the debug channel, once per process rather than
+            # on every gateway reconnect
+            if debug_channel and not self._startup_announced:
                 startup_embed = discord.Embed(
                     title="Plex Announcer Bot Online",
                     description="The Plex Announcer Bot is now online and monitoring your Plex server for new content.",  # noqa: E501
                     color=discord.Color.green(),
-                    timestamp=datetime.now(),
+                    timestamp=utcnow(),
                 )
                 startup_embed.add_field(
                     name="Monitoring Libraries",
-                    value=f"Movies: {self.movie_library}\nTV Shows: {self.tv_library}",
+                    value=(
+                        f"Movies: {self.config.movie_library}\n"
+                        f"TV Shows: {self.config.tv_library}"
+                    ),
                     inline=False,
                 )
+                if missing_channels:
+                    startup_embed.add_field(
+                        name="⚠️ Missing Channels",
+                        value="\n".join(missing_channels),
+                        inline=False,
+                    )
                 startup_embed.set_footer(text="Plex Announcer Bot")
 
                 try:
                     await debug_channel.send(embed=startup_embed)
+                    self._startup_announced = True
                     logger.info("Sent startup message to bot debug channel")
                 except Exception as e:
-                    logger.error(f"Error sending startup message: {e}")
+                    logger.error("Error sending startup message: %s", e)
 
-            # Check for specialized channels
-            if self.movie_channel_id:
-                movie_channel = self.bot.get_channel(self.movie_channel_id)
-                if movie_channel:
-                    logger.info(f"Found movie announcement channel: #{movie_channel.name}")
-                else:
-                    logger.error(f"Could not find movie channel with ID {self.movie_channel_id}")
+        def clear_channel_cache():
+            """Drop cached channels around gateway reconnects so stale objects are not reused."""
+            self._channel_cache.clear()
+            self._status_embed = None
 
-            if self.new_shows_channel_id:
-                new_shows_channel = self.bot.get_channel(self.new_shows_channel_id)
-                if new_shows_channel:
-                    logger.info(f"Found new shows announcement channel: #{new_shows_channel.name}")
-                else:
-                    logger.error(
-                        f"Could not find new shows channel with ID {self.new_shows_channel_id}"
-                    )
+        @self.bot.event
+        async def on_disconnect():
+            clear_channel_cache()
 
-            if self.recent_episodes_channel_id:
-                recent_episodes_channel = self.bot.get_channel(self.recent_episodes_channel_id)
-                if recent_episodes_channel:
-                    logger.info(
-                        f"Found recent episodes announcement channel: #{recent_episodes_channel.name}"  # noqa: E501
-                    )
-                else:
-                    logger.error(
-                        f"Could not find recent episodes channel with ID {self.recent_episodes_channel_id}"  # noqa: E501
-                    )
+        @self.bot.event
+        async def on_resumed():
+            clear_channel_cache()
+
+        @self.bot.event
+        async def on_guild_channel_delete(channel):
+            """Forget a deleted channel so announcements don't target it."""
+            self._channel_cache.pop(channel.id, None)
+            self._status_embed = None
 
-        @self.bot.command(name="status")
-        async def status(ctx: commands.Context):
+        @self.bot.event
+        async def on_guild_channel_update(before, after):
+            """Re-resolve an updated channel on its next use."""
+            self._channel_cache.pop(before.id, None)
+            self._status_embed = None
+
+        # Descriptions are explicit so they survive docstring stripping under python -OO
+        @self.tree.command(
+            name="status", description="Display the current bot status and configuration."
+        )
+        async def status(interaction: discord.Interaction):
             """Display the current bot status and configuration."""
-            if not ctx.guild:
-                await ctx.send("This command can only be used in a server.")
+            if not interaction.guild:
+                await interaction.response.send_message(
+                    "This command can only be used in a server.", ephemeral=True
+                )
                 return
 
             uptime = time.time() - self.start_time
@@ -204,80 +401,40 @@ class PlexDiscordBot:
 
             uptime_str = f"{int(days)}d {int(hours)}h {int(minutes)}m {int(seconds)}s"
 
-            embed = discord.Embed(
-                title="Plex Discord Bot Status",
-                color=discord.Color.blue(),
-                timestamp=datetime.now(),
-            )
-            embed.add_field(name="Uptime", value=uptime_str, inline=False)
-            embed.add_field(name="Movie Library", value=self.movie_library, inline=True)
-            embed.add_field(name="TV Library", value=self.tv_library, inline=True)
-            embed.add_field(
-                name="Notify Movies",
-                value="Yes" if self.notify_movies else "No",
-                inline=True,
-            )
-            embed.add_field(
-                name="Notify New Shows",
-                value="Yes" if self.notify_new_shows else "No",
-                inline=True,
-            )
-            embed.add_field(
-                name="Notify Recent Episodes",
-                value="Yes" if self.notify_recent_episodes else "No",
-                inline=True,
-            )
-            embed.add_field(
-                name="Recent Episode Days",
-                value=str(self.recent_episode_days),
-                inline=True,
-            )
-
-            # Add channel information
-            movie_channel = self.bot.get_channel(self.movie_channel_id)
-            movie_channel_name = f"#{movie_channel.name}" if movie_channel else "Not found"
-            embed.add_field(name="Movie Channel", value=movie_channel_name, inline=True)
-
-            new_shows_channel = self.bot.get_channel(self.new_shows_channel_id)
-            new_shows_channel_name = (
-                f"#{new_shows_channel.name}" if new_shows_channel else "Not found"
-            )
-            embed.add_field(name="New Shows Channel", value=new_shows_channel_name, inline=True)
-
-            recent_episodes_channel = self.bot.get_channel(self.recent_episodes_channel_id)
-            recent_episodes_name = (
-                f"#{recent_episodes_channel.name}" if recent_episodes_channel else "Not found"
-            )
-            embed.add_field(
-                name="Recent Episodes Channel",
-                value=recent_episodes_name,
-                inline=True,
-            )
+            # Only the uptime and timestamp change between calls
+            if self._status_embed is None:
+                self._status_embed = await self._build_status_embed()
+            embed = self._status_embed.copy()
+            embed.timestamp = utcnow()
+            embed.set_field_at(0, name="Uptime", value=uptime_str, inline=False)
 
-            debug_channel = self.bot.get_channel(self.bot_debug_channel_id)
-            debug_channel_name = f"#{debug_channel.name}" if debug_channel else "Not found"
-            embed.add_field(name="Debug Channel", value=debug_channel_name, inline=True)
+            await interaction.response.send_message(embed=embed)
 
-            await ctx.send(embed=embed)
-
-        @self.bot.command(name="healthcheck")
-        async def healthcheck(ctx: commands.Context):
+        @self.tree.command(
+            name="healthcheck", description="Check if the bot can connect to Plex and Discord."
+        )
+        async def healthcheck(interaction: discord.Interaction):
             """Check if the bot can connect to Plex and Discord."""
-            if not ctx.guild:
-                await ctx.send("This command can only be used in a server.")
+            if not interaction.guild:
+                await interaction.response.send_message(
+                    "This command can only be used in a server.", ephemeral=True
+                )
                 return
 
+            # Plex checks can take longer than the 3 second interaction deadline
+            await interaction.response.defer()
+
             embed = discord.Embed(
                 title="Plex Discord Bot Health Check",
                 color=discord.Color.blue(),
-                timestamp=datetime.now(),
+                timestamp=utcnow(),
             )
 
             # Check Discord connection
             embed.add_field(name="Discord Connection", value="✅ Connected", inline=False)
 
             # Check Plex connection
-            plex_connected = self.plex_monitor.connect()
+            plex_connected = await self._check_plex_connection()
             if plex_connected:
                 embed.add_field(
                     name="Plex Connection",
@@ -293,173 +450,684 @@ class PlexDiscordBot:
 
             # Check libraries
             if plex_connected:
-                movie_library = self.plex_monitor.get_library(self.movie_library)
+                # Plex calls are blocking HTTP requests, so keep them off the event loop
+                loop = asyncio.get_running_loop()
+                # The two library lookups are independent, so run them side by side
+                movie_library, tv_library = await asyncio.gather(
+                    loop.run_in_executor(
+                        None, self.plex_monitor.get_library, self.config.movie_library
+                    ),
+                    loop.run_in_executor(
+                        None, self.plex_monitor.get_library, self.config.tv_library
+                    ),
+                )
                 if movie_library:
                     embed.add_field(
-                        name=f"{self.movie_library} Library",
+                        name=f"{self.config.movie_library} Library",
                         value="✅ Available",
                         inline=True,
                     )
                 else:
                     embed.add_field(
-                        name=f"{self.movie_library} Library",
+                        name=f"{self.config.movie_library} Library",
                         value="❌ Not found",
                         inline=True,
                     )
 
-                tv_library = self.plex_monitor.get_library(self.tv_library)
                 if tv_library:
                     embed.add_field(
-                        name=f"{self.tv_library} Library",
+                        name=f"{self.config.tv_library} Library",
                         value="✅ Available",
                         inline=True,
                     )
                 else:
                     embed.add_field(
-                        name=f"{self.tv_library} Library",
+                        name=f"{self.config.tv_library} Library",
                         value="❌ Not found",
                         inline=True,
                     )
 
-            await ctx.send(embed=embed)
-
-        self.bot.add_listener(on_ready)
+            await interaction.followup.send(embed=embed)
 
     async def run(self):
         """Run the Discord bot."""
         # Start webhook server first if enabled
         webhook_server_started = False
-        if self.webhook_enabled:
+        if self.config.webhook_enabled:
             try:
                 from plex_announcer.core.webhook_server import PlexWebhookServer
 
-                logger.info(f"Starting webhook server on {self.webhook_host}:{self.webhook_port}")
+                logger.info(
+                    "Starting webhook server on %s:%s",
+                    self.config.webhook_host,
+                    self.config.webhook_port,
+                )
                 self.webhook_server = PlexWebhookServer(
-                    self, host=self.webhook_host, port=self.webhook_port
+                    self, host=self.config.webhook_host, port=self.config.webhook_port
                 )
                 await self.webhook_server.start()
                 webhook_server_started = True
                 logger.info(
-                    f"Webhook server started successfully on {self.webhook_host}:{self.webhook_port}"
+                    "Webhook server started successfully on %s:%s",
+                    self.config.webhook_host,
+                    self.config.webhook_port,
                 )
             except Exception as e:
-                logger.error(f"Failed to start webhook server: {e}", exc_info=True)
+                logger.error("Failed to start webhook server: %s", e, exc_info=True)
 
         # Run the Discord bot
         try:
             logger.info("Starting Discord bot")
-            await self.bot.start(self.token)
+            await self.bot.start(self.config.discord_token)
         except Exception as e:
-            logger.error(f"Error starting Discord bot: {e}", exc_info=True)
+            logger.error("Error starting Discord bot: %s", e, exc_info=True)
         finally:
+            # Stop taking webhooks first so in-flight announcements can still reach Discord
             if webhook_server_started and self.webhook_server:
                 logger.info("Stopping webhook server")
                 await self.webhook_server.stop()
+            # Queued episodes go out over REST, so send them before the client closes
+            await self._stop_episode_queue()
+            # Close the gateway connection when cancelled by a shutdown signal
+            if not self.bot.is_closed():
+                await self.bot.close()
+            if self._flush_task and not self._flush_task.done():
+                self._flush_task.cancel()
+                save_processed_media(self.processed_media, self.config.data_file)
+            if self._http_session:
+                await self._http_session.close()
+
+    @staticmethod
+    def _rating_key(metadata: dict) -> Optional[int]:
+        """Return the Plex rating key from webhook metadata, if present."""
+        try:
+            return int(metadata["ratingKey"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    async def _get_recent_media(self) -> Tuple[list, list]:
+        """Return recently added movies and episodes, reusing a result younger than the TTL."""
+        now = time.monotonic()
+        if self._recent_media is not None and now < self._recent_media_expires:
+            return self._recent_media
+
+        # Both lookups are blocking Plex requests, so run them side by side
+        loop = asyncio.get_running_loop()
+        recent_media = await asyncio.gather(
+            loop.run_in_executor(
+                None, functools.partial(self.plex_monitor.get_recently_added_movies, days=7)
+            ),
+            loop.run_in_executor(
+                None, functools.partial(self.plex_monitor.get_recently_added_episodes, days=7)
+            ),
+        )
+        self._recent_media = tuple(recent_media)
+        self._recent_media_expires = now + RECENT_MEDIA_TTL
+        return self._recent_media
+
+    async def _check_plex_connection(self) -> bool:
+        """Return whether Plex is reachable, reusing a check made in the last few seconds."""
+        now = time.monotonic()
+        if now < self._plex_connected_expires:
+            return self._plex_connected
+
+        # plexapi connects with blocking HTTP requests, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        self._plex_connected = await loop.run_in_executor(None, self.plex_monitor.connect)
+        self._plex_connected_expires = time.monotonic() + PLEX_CONNECT_CHECK_TTL
+        return self._plex_connected
+
+    def _mark_processed(self, rating_key: Optional[int]) -> None:
+        """Record an announced item and schedule a write of the processed media file."""
+        if rating_key is None:
+            return
+        # Something new was announced, so the cached recent media is out of date
+        self._recent_media = None
+        self.processed_media[rating_key] = None
+        self.processed_media.move_to_end(rating_key)
+        self._unsaved_media[rating_key] = None
+        if len(self.processed_media) > MAX_PROCESSED_MEDIA:
+            self.processed_media.popitem(last=False)
+        self._schedule_flush()
+
+    def _forget_processed(
+        self, rating_key: Optional[int], announcement: Optional[tuple] = None
+    ) -> None:
+        """Undo the claims of a failed announcement so a repeated webhook can retry."""
+        self._recent_announcements.pop(announcement, None)
+        if rating_key in self.processed_media:
+            del self.processed_media[rating_key]
+            if rating_key in self._unsaved_media:
+                del self._unsaved_media[rating_key]
+            else:
+                # The log can only add keys, so drop this one with a full save
+                self._needs_compaction = True
+            self._schedule_flush()
+
+    def _claim_announcement(self, key: Optional[tuple]) -> bool:
+        """Record an announcement, or return False if the same title went out moments ago.
+
+        A key of None means the webhook lacks the fields that identify the title, so only the
+        rating key guards against repeats.
+        """
+        if key is None:
+            return True
+        now = time.monotonic()
+        if self._recent_announcements.get(key, 0.0) > now - ANNOUNCE_COOLDOWN:
+            return False
+        self._recent_announcements[key] = now
+        self._recent_announcements.move_to_end(key)
+        if len(self._recent_announcements) > MAX_RECENT_ANNOUNCEMENTS:
+            self._recent_announcements.popitem(last=False)
+        return True
+
+    def _schedule_flush(self) -> None:
+        """Schedule a debounced write of the processed media file."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_processed_media())
+
+    async def _flush_processed_media(self) -> None:
+        """Write processed media to disk off the event loop.
+
+        New keys are appended to a log, so a write costs only what changed since the last one.
+        The whole list is saved instead once the log grows long or a logged key is forgotten.
+        """
+        await asyncio.sleep(PROCESSED_MEDIA_FLUSH_DELAY)
+        # Anything marked from here on schedules its own flush
+        self._flush_task = None
+        unsaved = list(self._unsaved_media)
+        self._unsaved_media.clear()
+        compact = (
+            self._needs_compaction
+            or self._logged_media_count + len(unsaved) > PROCESSED_MEDIA_COMPACT_AFTER
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            if compact:
+                self._needs_compaction = False
+                self._logged_media_count = 0
+                await loop.run_in_executor(
+                    None, save_processed_media, list(self.processed_media), self.config.data_file
+                )
+            else:
+                self._logged_media_count += len(unsaved)
+                await loop.run_in_executor(
+                    None, append_processed_media, unsaved, self.config.data_file
+                )
+        except OSError as e:
+            # Fall back to a full save next time, which also covers the keys lost here
+            self._needs_compaction = True
+            logger.error("Error saving processed media to %s: %s", self.config.data_file, e)
+
+    async def _verify_channels(self) -> List[str]:
+        """Resolve the announcement channels concurrently and describe any that are missing."""
+        configured = [
+            (channel_id, label) for channel_id, label in self._specialized_channels if channel_id
+        ]
+        # Cache misses fall back to REST fetches, so don't wait on them one by one
+        channels = await asyncio.gather(
+            *(self._get_channel(channel_id) for channel_id, _ in configured)
+        )
+
+        missing = []
+        for (channel_id, label), channel in zip(configured, channels):
+            if channel:
+                logger.info("Found %s announcement channel: #%s", label, channel.name)
+            else:
+                logger.error("Could not find %s channel with ID %s", label, channel_id)
+                missing.append(f"{label}: {channel_id}")
+        return missing
+
+    async def _build_status_embed(self) -> discord.Embed:
+        """Build the /status embed fields that only change when channels are re-resolved."""
+        embed = discord.Embed(
+            title="Plex Discord Bot Status",
+            color=discord.Color.blue(),
+        )
+        # Placeholder, filled in per call by the status command
+        embed.add_field(name="Uptime", value="-", inline=False)
+        embed.add_field(name="Movie Library", value=self.config.movie_library, inline=True)
+        embed.add_field(name="TV Library", value=self.config.tv_library, inline=True)
+        embed.add_field(
+            name="Notify Movies",
+            value="Yes" if self.config.notify_movies else "No",
+            inline=True,
+        )
+        embed.add_field(
+            name="Notify New Shows",
+            value="Yes" if self.config.notify_new_shows else "No",
+            inline=True,
+        )
+        embed.add_field(
+            name="Notify Recent Episodes",
+            value="Yes" if self.config.notify_recent_episodes else "No",
+            inline=True,
+        )
+        embed.add_field(
+            name="Recent Episode Days",
+            value=str(self.config.recent_episode_days),
+            inline=True,
+        )
+
+        # Add channel information, resolving cache misses side by side
+        channel_fields = self._specialized_channels + ((self.config.bot_debug_channel_id, "Debug"),)
+        channels = await asyncio.gather(
+            *(self._get_channel(channel_id) for channel_id, _ in channel_fields)
+        )
+        for (_, label), channel in zip(channel_fields, channels):
+            embed.add_field(
+                name=f"{label} Channel",
+                value=f"#{channel.name}" if channel else "Not found",
+                inline=True,
+            )
+
+        return embed
+
+    async def _get_channel(self, channel_id: int) -> Optional[discord.abc.Messageable]:
+        """Return a cached channel, falling back to a REST fetch on a cache miss."""
+        if not channel_id:
+            return None
+
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                try:
+                    channel = await self.bot.fetch_channel(channel_id)
+                except discord.DiscordException as e:
+                    logger.error("Error fetching channel %s: %s", channel_id, e)
+                    return None
+            self._channel_cache[channel_id] = channel
+        return channel
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session shared by artwork downloads and Discord webhooks."""
+        # Created lazily so both bind to the running event loop
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession()
+            self._plex_fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PLEX_FETCHES)
+        return self._http_session
+
+    async def _get_destination(
+        self, channel_id: int, webhook_url: Optional[str]
+    ) -> Optional[discord.abc.Messageable]:
+        """Return the configured Discord webhook for announcements, or else the channel."""
+        if not webhook_url:
+            return await self._get_channel(channel_id)
+
+        webhook = self._webhooks.get(webhook_url)
+        if webhook is None:
+            # Webhooks have their own rate limits, separate from the bot's channel sends
+            webhook = discord.Webhook.from_url(webhook_url, session=self._get_http_session())
+            self._webhooks[webhook_url] = webhook
+        return webhook
+
+    async def _fetch_poster(
+        self, thumb: Optional[str], rating_key: Optional[int]
+    ) -> Optional[discord.File]:
+        """Download artwork from Plex so it can be uploaded with the announcement.
+
+        Plex is usually only reachable on the LAN and its image URLs carry the
+        Plex token, so Discord is never pointed at the server directly.
+        """
+        plex = getattr(self.plex_monitor, "plex", None)
+        if not thumb or plex is None:
+            return None
+        # Absolute URLs are public already and the embed builder links them directly
+        if thumb.startswith(("http://", "https://")):
+            return None
+
+        session = self._get_http_session()
+        try:
+            # Bound concurrent downloads so a burst of webhooks can't swamp the Plex server
+            async with self._plex_fetch_semaphore:
+                async with session.get(
+                    plex.transcodeImage(thumb, height=POSTER_HEIGHT, width=POSTER_WIDTH),
+                    timeout=aiohttp.ClientTimeout(total=POSTER_FETCH_TIMEOUT),
+                ) as response:
+                    response.raise_for_status()
+                    data = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Could not fetch artwork %s from Plex: %s", thumb, e)
+            return None
+
+        # Names must be unique within a message, so number items that have no rating key
+        name = rating_key if rating_key is not None else f"media_{next(self._poster_ids)}"
+        return discord.File(io.BytesIO(data), filename=f"poster_{name}.jpg")
+
+    async def _send_embeds(
+        self,
+        channel,
+        embeds: List[discord.Embed],
+        files: Optional[List[Optional[discord.File]]] = None,
+    ) -> None:
+        """Send embeds to a channel, packing up to ten into each message.
+
+        ``files`` optionally holds one attachment (or None) per embed, such as
+        the poster its thumbnail refers to.
+        """
+        files = files or [None] * len(embeds)
+        lock = self._channel_send_locks.setdefault(channel.id, asyncio.Lock())
+        for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+            chunk = embeds[start : start + MAX_EMBEDS_PER_MESSAGE]
+            chunk_files = [f for f in files[start : start + MAX_EMBEDS_PER_MESSAGE] if f]
+            async with lock:
+                await self._send_chunk(channel, chunk, chunk_files)
+
+    async def _send_chunk(
+        self, channel, embeds: List[discord.Embed], files: List[discord.File]
+    ) -> None:
+        """Send one message, spaced out from the previous one to the same channel."""
+        wait = (
+            self._channel_last_send.get(channel.id, 0.0) + CHANNEL_SEND_INTERVAL - time.monotonic()
+        )
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            await channel.send(embeds=embeds, files=files)
+        except discord.HTTPException as e:
+            if e.status == 413 and files:
+                # Too large with the artwork attached; the announcement matters more
+                logger.warning("Message to #%s too large, sending it without artwork", channel)
+                for embed in embeds:
+                    if (embed.thumbnail.url or "").startswith("attachment://"):
+                        embed.set_thumbnail(url=None)
+                await channel.send(embeds=embeds, files=[])
+            elif e.status == 429:
+                # discord.py normally absorbs rate limits; honour retry_after if one leaks out
+                retry_after = getattr(e, "retry_after", None) or 1.0
+                logger.warning("Rate limited sending to #%s, retrying in %ss", channel, retry_after)
+                await asyncio.sleep(retry_after)
+                for f in files:
+                    f.reset()
+                await channel.send(embeds=embeds, files=files)
+            else:
+                raise
+        self._channel_last_send[channel.id] = time.monotonic()
 
     # Webhook handling methods
+    def should_process(self, media_type: Optional[str]) -> bool:
+        """Return True if new media of this type would be announced right now."""
+        return media_type in self._enabled_media_types and self.bot.is_ready()
+
+    async def announce_from_webhook(self, media_type: str, metadata: dict) -> None:
+        """Announce new media of any supported Plex type; other types are ignored."""
+        handler = self._announce_dispatch.get(media_type)
+        if handler is not None:
+            await handler(metadata)
+
     async def announce_new_movie_from_webhook(self, metadata: dict):
         """Announce a new movie from webhook data."""
-        if not self.notify_movies or not self.bot.is_ready():
+        if not self.config.notify_movies or not self.bot.is_ready():
             return
 
-        logger.info(f"Processing webhook for new movie: {metadata.get('title')}")
+        rating_key = self._rating_key(metadata)
+        if rating_key in self.processed_media:
+            logger.info("Skipping already announced movie: %s", metadata.get("title"))
+            return
+
+        m = ChainMap(metadata, _MOVIE_DEFAULTS)
+        announcement = ("movie", m["title"], m["year"]) if metadata.get("title") else None
+        if not self._claim_announcement(announcement):
+            logger.info("Skipping recently announced movie: %s", m["title"])
+            return
+
+        # Claim the key before any await, so a duplicate webhook arriving meanwhile is skipped
+        self._mark_processed(rating_key)
+
+        logger.info("Processing webhook for new movie: %s", metadata.get("title"))
 
         try:
-            channel = self.bot.get_channel(self.movie_channel_id)
+            channel = await self._get_destination(
+                self.config.movie_channel_id, self.config.movie_webhook_url
+            )
             if not channel:
-                logger.error(f"Could not find movie channel with ID {self.movie_channel_id}")
+                logger.error(
+                    "Could not find movie channel with ID %s", self.config.movie_channel_id
+                )
+                self._forget_processed(rating_key, announcement)
                 return
 
             # Basic movie info from webhook
             movie_data = {
-                "title": metadata.get("title", "Unknown Title"),
-                "summary": metadata.get("summary", "No summary available"),
-                "year": metadata.get("year", "Unknown Year"),
-                "tagline": metadata.get("tagline", ""),
-                "thumb": metadata.get("thumb", ""),
-                "art": metadata.get("art", ""),
-                "duration": metadata.get("duration", 0),
-                "rating": metadata.get("rating", 0.0),
-                "added_at": int(time.time()),
+                "title": m["title"],
+                "summary": m["summary"],
+                "year": m["year"],
+                "tagline": m["tagline"],
+                "thumb": m["thumb"],
+                "art": m["art"],
+                "duration": m["duration"],
+                "rating": m["rating"],
+                "added_at": time.time_ns() // 1_000_000_000,
             }
 
             # Create and send embed
             embed = EmbedBuilder.build_movie_embed(movie_data)
-            await channel.send(embed=embed)
-            logger.info(f"Announced new movie from webhook: {movie_data['title']}")
+            poster = await self._fetch_poster(movie_data["thumb"], rating_key)
+            if poster:
+                embed.set_thumbnail(url=f"attachment://{poster.filename}")
+            await self._send_embeds(channel, [embed], [poster])
+            logger.info("Announced new movie from webhook: %s", movie_data["title"])
+        except asyncio.CancelledError:
+            self._forget_processed(rating_key, announcement)
+            raise
         except Exception as e:
-            logger.error(f"Error announcing movie from webhook: {e}", exc_info=True)
+            self._forget_processed(rating_key, announcement)
+            logger.error("Error announcing movie from webhook: %s", e, exc_info=True)
 
     async def announce_new_episode_from_webhook(self, metadata: dict):
         """Announce a new episode from webhook data."""
-        if not self.notify_recent_episodes or not self.bot.is_ready():
+        if not self.config.notify_recent_episodes or not self.bot.is_ready():
             return
 
-        logger.info(f"Processing webhook for new episode: {metadata.get('title')}")
+        rating_key = self._rating_key(metadata)
+        if rating_key in self.processed_media:
+            logger.info("Skipping already announced episode: %s", metadata.get("title"))
+            return
 
-        try:
-            channel = self.bot.get_channel(self.recent_episodes_channel_id)
-            if not channel:
-                logger.error(
-                    f"Could not find episodes channel with ID {self.recent_episodes_channel_id}"
-                )
-                return
+        m = ChainMap(metadata, _EPISODE_DEFAULTS)
+        label = f"{m['grandparentTitle']} S{m['parentIndex']}E{m['index']}"
+        # Without these every such episode would share one "Unknown Show S0E0" claim
+        identified = all(metadata.get(field) is not None for field in _EPISODE_IDENTITY)
+        announcement = ("episode", label) if identified else None
+        if not self._claim_announcement(announcement):
+            logger.info("Skipping recently announced episode: %s", label)
+            return
 
+        # Claim the key before any await, so a duplicate webhook arriving meanwhile is skipped
+        self._mark_processed(rating_key)
+
+        logger.info("Processing webhook for new episode: %s", metadata.get("title"))
+
+        try:
             # Basic episode info from webhook
-            show_title = metadata.get("grandparentTitle", "Unknown Show")
+            show_title = m["grandparentTitle"]
             episode_data = {
-                "title": metadata.get("title", "Unknown Title"),
-                "summary": metadata.get("summary", "No summary available"),
-                "season": metadata.get("parentIndex", 0),
-                "episode": metadata.get("index", 0),
+                "title": m["title"],
+                "summary": m["summary"],
+                "season": m["parentIndex"],
+                "episode": m["index"],
                 "show_title": show_title,
-                "thumb": metadata.get("thumb", ""),
-                "art": metadata.get("art", ""),
-                "grandparentThumb": metadata.get("grandparentThumb", ""),
-                "duration": metadata.get("duration", 0),
-                "added_at": int(time.time()),
+                "thumb": m["thumb"],
+                "art": m["art"],
+                "grandparentThumb": m["grandparentThumb"],
+                "duration": m["duration"],
+                "added_at": time.time_ns() // 1_000_000_000,
             }
 
-            # Create and send embed
+            # Create the embed and queue it, so a season drop goes out in a few messages.
+            # Nothing before this awaits, so episodes are queued in webhook order; the
+            # channel is resolved and artwork fetched per batch
             embed = EmbedBuilder.build_episode_embed(episode_data)
-            await channel.send(embed=embed)
-            logger.info(
-                f"Announced new episode from webhook: {show_title} S{episode_data['season']}E{episode_data['episode']}"
+            thumb = episode_data["grandparentThumb"] or episode_data["thumb"]
+            self._episode_queue.put_nowait((rating_key, embed, thumb, label, announcement))
+            if self._episode_drain_task is None:
+                self._episode_drain_task = asyncio.create_task(self._drain_episode_queue())
+        except Exception as e:
+            self._forget_processed(rating_key, announcement)
+            logger.error("Error announcing episode from webhook: %s", e, exc_info=True)
+
+    async def _drain_episode_queue(self) -> None:
+        """Send queued episode announcements, up to ten embeds per message.
+
+        A None in the queue marks shutdown: everything queued before it is sent without
+        waiting for the batch window, then the drain returns.
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._episode_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            try:
+                # Give the rest of a burst a moment to arrive, but send once a message is full
+                deadline = loop.time() + EPISODE_BATCH_WINDOW
+                while len(batch) < MAX_EMBEDS_PER_MESSAGE:
+                    if not self._episode_queue.empty():
+                        item = self._episode_queue.get_nowait()
+                    else:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(self._episode_queue.get(), remaining)
+                        except asyncio.TimeoutError:
+                            break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+            except asyncio.CancelledError:
+                self._forget_episodes(batch)
+                raise
+            await self._send_episode_batch(batch)
+
+    async def _stop_episode_queue(self) -> None:
+        """Send the episodes still queued at shutdown, releasing any that don't go out."""
+        if self._episode_drain_task is None:
+            return
+
+        self._episode_queue.put_nowait(None)
+        try:
+            await asyncio.wait_for(self._episode_drain_task, EPISODE_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out sending queued episode announcements on shutdown")
+        self._episode_drain_task = None
+
+        # Release what was never sent, so Plex repeating the webhook announces it after all
+        unsent = [item for item in self._drain_queue_nowait() if item is not None]
+        if unsent:
+            logger.warning("Dropping %d queued episode announcements on shutdown", len(unsent))
+            self._forget_episodes(unsent)
+
+    def _drain_queue_nowait(self) -> list:
+        """Remove and return everything currently in the episode queue."""
+        items = []
+        while not self._episode_queue.empty():
+            items.append(self._episode_queue.get_nowait())
+        return items
+
+    def _forget_episodes(self, batch: list) -> None:
+        """Release the claims of queued episode announcements that were not sent."""
+        for rating_key, _, _, _, announcement in batch:
+            self._forget_processed(rating_key, announcement)
+
+    async def _send_episode_batch(self, batch: list) -> None:
+        """Send one batch of queued episode announcements to the episodes channel."""
+        try:
+            channel = await self._get_destination(
+                self.config.recent_episodes_channel_id, self.config.recent_episodes_webhook_url
             )
+            if not channel:
+                raise LookupError(
+                    f"Could not find episodes channel with ID "
+                    f"{self.config.recent_episodes_channel_id}"
+                )
+
+            # Fetch each distinct poster once and attach it once, with every embed using it
+            # pointing at the same attachment
+            thumbs = list(dict.fromkeys(thumb for _, _, thumb, _, _ in batch if thumb))
+            fetched = await asyncio.gather(*(self._fetch_poster(thumb, None) for thumb in thumbs))
+            posters = dict(zip(thumbs, fetched))
+
+            # One timestamp for the whole batch, so episodes posted together show the same time
+            sent_at = utcnow()
+            embeds = []
+            files = []
+            for _, embed, thumb, _, _ in batch:
+                embed.timestamp = sent_at
+                poster = posters.get(thumb)
+                if poster:
+                    embed.set_thumbnail(url=f"attachment://{poster.filename}")
+                files.append(poster if poster not in files else None)
+                embeds.append(embed)
+
+            await self._send_embeds(channel, embeds, files)
+            for _, _, _, label, _ in batch:
+                logger.info("Announced new episode from webhook: %s", label)
+        except asyncio.CancelledError:
+            self._forget_episodes(batch)
+            raise
         except Exception as e:
-            logger.error(f"Error announcing episode from webhook: {e}", exc_info=True)
+            self._forget_episodes(batch)
+            logger.error("Error announcing episodes from webhook: %s", e, exc_info=True)
 
     async def announce_new_show_from_webhook(self, metadata: dict):
         """Announce a new show from webhook data."""
-        if not self.notify_new_shows or not self.bot.is_ready():
+        if not self.config.notify_new_shows or not self.bot.is_ready():
             return
 
-        logger.info(f"Processing webhook for new show: {metadata.get('title')}")
+        rating_key = self._rating_key(metadata)
+        if rating_key in self.processed_media:
+            logger.info("Skipping already announced show: %s", metadata.get("title"))
+            return
+
+        m = ChainMap(metadata, _SHOW_DEFAULTS)
+        announcement = ("show", m["title"], m["year"]) if metadata.get("title") else None
+        if not self._claim_announcement(announcement):
+            logger.info("Skipping recently announced show: %s", m["title"])
+            return
+
+        # Claim the key before any await, so a duplicate webhook arriving meanwhile is skipped
+        self._mark_processed(rating_key)
+
+        logger.info("Processing webhook for new show: %s", metadata.get("title"))
 
         try:
-            channel = self.bot.get_channel(self.new_shows_channel_id)
+            channel = await self._get_destination(
+                self.config.new_shows_channel_id, self.config.new_shows_webhook_url
+            )
             if not channel:
                 logger.error(
-                    f"Could not find new shows channel with ID {self.new_shows_channel_id}"
+                    "Could not find new shows channel with ID %s", self.config.new_shows_channel_id
                 )
+                self._forget_processed(rating_key, announcement)
                 return
 
             # Basic show info from webhook
             show_data = {
-                "title": metadata.get("title", "Unknown Title"),
-                "summary": metadata.get("summary", "No summary available"),
-                "year": metadata.get("year", "Unknown Year"),
-                "thumb": metadata.get("thumb", ""),
-                "art": metadata.get("art", ""),
-                "added_at": int(time.time()),
+                "title": m["title"],
+                "summary": m["summary"],
+                "year": m["year"],
+                "thumb": m["thumb"],
+                "art": m["art"],
+                "added_at": time.time_ns() // 1_000_000_000,
             }
 
             # Create and send embed
             embed = EmbedBuilder.build_show_embed(show_data)
-            await channel.send(embed=embed)
-            logger.info(f"Announced new show from webhook: {show_data['title']}")
+            poster = await self._fetch_poster(show_data["thumb"], rating_key)
+            if poster:
+                embed.set_thumbnail(url=f"attachment://{poster.filename}")
+            await self._send_embeds(channel, [embed], [poster])
+            logger.info("Announced new show from webhook: %s", show_data["title"])
+        except asyncio.CancelledError:
+            self._forget_processed(rating_key, announcement)
+            raise
         except Exception as e:
-            logger.error(f"Error announcing show from webhook: {e}", exc_info=True)
+            self._forget_processed(rating_key, announcement)
+            logger.error("Error announcing show from webhook: %s", e, exc_info=True)
 
 
 # For backward compatibility
@@ -2,8 +2,10 @@
 Webhook server to receive Plex notifications.
 """
 
+import asyncio
 import json
 import logging
+from typing import Set
 
 from aiohttp import web
 
@@ -11,6 +13,9 @@ from plex_announcer.core.discord_bot import PlexDiscordBot
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for in-flight announcements when the server stops
+SHUTDOWN_GRACE_PERIOD = 5
+
 
 class PlexWebhookServer:
     """Server to receive Plex webhooks and forward to the Discord bot."""
@@ -37,6 +42,8 @@ class PlexWebhookServer:
         )
         self.runner = None
         self.site = None
+        # Announcements still running, kept referenced so they aren't garbage collected
+        self._pending_announcements: Set[asyncio.Task] = set()
 
     async def start(self) -> None:
         """Start the webhook server."""
@@ -64,6 +71,17 @@ class PlexWebhookServer:
         if self.site:
             logger.info("Shutting down webhook server")
             await self.site.stop()
+        if self._pending_announcements:
+            # Give in-flight announcements a moment to finish before the bot disconnects
+            _, pending = await asyncio.wait(
+                self._pending_announcements, timeout=SHUTDOWN_GRACE_PERIOD
+            )
+            # Cancel the rest so they release their claims before processed media is saved
+            if pending:
+                logger.warning("Cancelling %d unfinished announcements", len(pending))
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
         if self.runner:
             await self.runner.cleanup()
         logger.info("Webhook server stopped")
@@ -110,13 +128,14 @@ class PlexWebhookServer:
         try:
             metadata = payload.get("Metadata", {})
             media_type = metadata.get("type")
-
-            if media_type == "movie":
-                await self.discord_bot.announce_new_movie_from_webhook(metadata)
-            elif media_type == "episode":
-                await self.discord_bot.announce_new_episode_from_webhook(metadata)
-            elif media_type == "show":
-                await self.discord_bot.announce_new_show_from_webhook(metadata)
+            if not self.discord_bot.should_process(media_type):
+                logger.debug("Not announcing %s: disabled or bot not ready", media_type)
+                return
+
+            # Announce in the background so Plex gets its response without waiting on Discord
+            task = asyncio.create_task(self.discord_bot.announce_from_webhook(media_type, metadata))
+            self._pending_announcements.add(task)
+            task.add_done_callback(self._pending_announcements.discard)
         except Exception as e:
             logger.error(f"Error handling new media webhook: {e}", exc_info=True)
 
@@ -0,0 +1,23 @@
+"""Tests for the command-line interface."""
+
+import importlib
+
+import pytest
+
+
+def test_cli_importable():
+    """Test that the single CLI module imports and exposes its entry points."""
+    cli = importlib.import_module("plex_announcer.cli")
+    assert callable(cli.run)
+    assert callable(cli.main)
+
+
+def test_cli_version(capsys):
+    """Test that --version exits before any bot setup."""
+    from plex_announcer import __version__
+    from plex_announcer.cli import parse_args
+
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args(["--version"])
+    assert exc_info.value.code == 0
+    assert __version__ in capsys.readouterr().out
@@ -0,0 +1,278 @@
+"""Tests for the webhook announcement paths of the Discord bot."""
+
+import asyncio
+import io
+from unittest import mock
+
+import discord
+import pytest
+
+from plex_announcer.core import discord_bot
+from plex_announcer.core.discord_bot import PlexDiscordBot
+from plex_announcer.utils.config import Config
+
+
+class FakeChannel:
+    """Announcement destination that records what was sent to it."""
+
+    id = 1234
+    name = "announcements"
+
+    def __init__(self, error=None):
+        """Record sends, or fail every send with ``error``."""
+        self.error = error
+        self.sent = []
+        self.files = []
+
+    async def send(self, embeds, files):
+        """Record the embeds and files of one message."""
+        if self.error:
+            raise self.error
+        self.sent.append(embeds)
+        self.files.append(files)
+
+
+@pytest.fixture
+def channel():
+    """Return the fake channel every announcement is sent to."""
+    return FakeChannel()
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch, channel):
+    """Return a ready bot whose announcement channels all resolve to the fake channel."""
+    monkeypatch.setattr(discord_bot, "EPISODE_BATCH_WINDOW", 0.05)
+    monkeypatch.setattr(discord_bot, "CHANNEL_SEND_INTERVAL", 0)
+    monkeypatch.setattr(discord_bot, "PROCESSED_MEDIA_FLUSH_DELAY", 0)
+
+    config = Config(
+        discord_token="token",
+        movie_channel_id=1,
+        new_shows_channel_id=2,
+        recent_episodes_channel_id=3,
+        bot_debug_channel_id=4,
+        plex_base_url="http://plex:32400",
+        plex_token="plex-token",
+        data_file=str(tmp_path / "processed_media.json"),
+    )
+    bot = PlexDiscordBot(config, mock.Mock(plex=None))
+    bot.bot.is_ready = lambda: True
+    bot.bot.get_channel = lambda channel_id: channel
+    return bot
+
+
+def episode(index, rating_key=None):
+    """Webhook metadata for episode ``index`` of a show's first season."""
+    return {
+        "title": f"Episode {index}",
+        "ratingKey": str(rating_key or 100 + index),
+        "grandparentTitle": "Show",
+        "parentIndex": 1,
+        "index": index,
+    }
+
+
+@pytest.mark.asyncio
+async def test_episode_burst_is_split_into_full_messages(bot, channel):
+    """Test that queued episodes go out ten embeds per message."""
+    for index in range(12):
+        await bot.announce_new_episode_from_webhook(episode(index))
+    await bot._stop_episode_queue()
+
+    assert [len(embeds) for embeds in channel.sent] == [10, 2]
+    assert len(bot.processed_media) == 12
+
+
+@pytest.mark.asyncio
+async def test_concurrent_episodes_keep_webhook_order(bot, channel):
+    """Test that episodes handled concurrently are posted in the order they arrived."""
+    await asyncio.gather(*(bot.announce_new_episode_from_webhook(episode(i)) for i in range(8)))
+    await bot._stop_episode_queue()
+
+    assert [embed.description.split(" - ")[0] for embed in channel.sent[0]] == [
+        f"**S1E{index}" for index in range(8)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_episode_send_releases_claims(bot, channel):
+    """Test that a failed batch can be announced again when Plex repeats the webhook."""
+    channel.error = discord.HTTPException(mock.Mock(status=500, reason="Server Error"), "boom")
+    await bot.announce_new_episode_from_webhook(episode(1))
+    await bot._stop_episode_queue()
+    assert not bot.processed_media
+
+    channel.error = None
+    await bot.announce_new_episode_from_webhook(episode(1))
+    await bot._stop_episode_queue()
+    assert [len(embeds) for embeds in channel.sent] == [1]
+
+
+@pytest.mark.asyncio
+async def test_failed_movie_send_releases_claims(bot, channel):
+    """Test that a failed movie announcement forgets its rating key and title."""
+    channel.error = discord.HTTPException(mock.Mock(status=500, reason="Server Error"), "boom")
+    metadata = {"title": "Dune", "year": 2021, "ratingKey": "5"}
+    await bot.announce_new_movie_from_webhook(metadata)
+    assert not bot.processed_media
+
+    channel.error = None
+    await bot.announce_new_movie_from_webhook(metadata)
+    assert len(channel.sent) == 1
+    assert list(bot.processed_media) == [5]
+
+
+@pytest.mark.asyncio
+async def test_cooldown_skips_same_title_under_new_rating_key(bot, channel):
+    """Test that a metadata refresh with a new rating key is not announced twice."""
+    await bot.announce_new_movie_from_webhook({"title": "Dune", "year": 2021, "ratingKey": "5"})
+    await bot.announce_new_movie_from_webhook({"title": "Dune", "year": 2021, "ratingKey": "6"})
+    await bot.announce_new_movie_from_webhook({"title": "Dune", "year": 1984, "ratingKey": "7"})
+
+    assert [embeds[0].title for embeds in channel.sent] == [
+        "New Movie Added: Dune (2021)",
+        "New Movie Added: Dune (1984)",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_movie_without_year_has_plain_title(bot, channel):
+    """Test that a movie whose webhook has no year is titled without one."""
+    await bot.announce_new_movie_from_webhook({"title": "Dune", "ratingKey": "5"})
+
+    assert channel.sent[0][0].title == "New Movie Added: Dune"
+
+
+@pytest.mark.asyncio
+async def test_cooldown_ignores_unidentifiable_episodes(bot, channel):
+    """Test that episodes without show or index fields don't block each other."""
+    await bot.announce_new_episode_from_webhook({"title": "A", "ratingKey": "1"})
+    await bot.announce_new_episode_from_webhook({"title": "B", "ratingKey": "2"})
+    await bot._stop_episode_queue()
+
+    assert [len(embeds) for embeds in channel.sent] == [2]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_send_is_retried(bot):
+    """Test that a 429 leaking out of discord.py is retried after retry_after."""
+    rate_limited = discord.HTTPException(mock.Mock(status=429, reason="Too Many Requests"), "")
+    rate_limited.retry_after = 0.01
+    destination = mock.Mock(id=1)
+    destination.send = mock.AsyncMock(side_effect=[rate_limited, None])
+
+    await bot._send_embeds(destination, [discord.Embed(title="Dune")])
+
+    assert destination.send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shutdown_sends_queued_episodes(bot, channel, monkeypatch):
+    """Test that episodes still waiting for the batch window are sent on shutdown."""
+    monkeypatch.setattr(discord_bot, "EPISODE_BATCH_WINDOW", 60)
+    for index in range(3):
+        await bot.announce_new_episode_from_webhook(episode(index))
+
+    await bot._stop_episode_queue()
+
+    assert [len(embeds) for embeds in channel.sent] == [3]
+    assert len(bot.processed_media) == 3
+
+
+class FakeResponse:
+    """Minimal aiohttp response carrying a fixed body."""
+
+    async def __aenter__(self):
+        """Return the response itself."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Do nothing; there is no connection to release."""
+        return False
+
+    def raise_for_status(self):
+        """Accept every response as successful."""
+        pass
+
+    async def read(self):
+        """Return the image body."""
+        return b"jpeg"
+
+
+@pytest.mark.asyncio
+async def test_fetch_poster_names_and_public_urls(bot):
+    """Test poster attachment names and that public artwork is not fetched from Plex."""
+    bot.plex_monitor.plex = mock.Mock()
+    bot.plex_monitor.plex.transcodeImage.side_effect = lambda path, height, width: (
+        f"http://plex/photo/:/transcode?url={path}&width={width}&height={height}"
+    )
+    session = mock.Mock()
+    session.get.side_effect = lambda url, timeout: FakeResponse()
+    bot._http_session = session
+    bot._plex_fetch_semaphore = asyncio.Semaphore(1)
+
+    assert await bot._fetch_poster("https://image.tmdb.org/dune.jpg", 5) is None
+    session.get.assert_not_called()
+
+    keyed = await bot._fetch_poster("/library/metadata/5/thumb", 5)
+    first = await bot._fetch_poster("/library/metadata/6/thumb", None)
+    second = await bot._fetch_poster("/library/metadata/7/thumb", None)
+    assert keyed.filename == "poster_5.jpg"
+    assert "width=300&height=450" in session.get.call_args_list[0].args[0]
+    assert first.filename != second.filename
+
+
+@pytest.mark.asyncio
+async def test_cancelled_movie_send_releases_claims(bot, channel):
+    """Test that an announcement cancelled on shutdown forgets its rating key and title."""
+    started = asyncio.Event()
+
+    async def hang(embeds, files):
+        started.set()
+        await asyncio.Event().wait()
+
+    channel.send = hang
+    task = asyncio.ensure_future(
+        bot.announce_new_movie_from_webhook({"title": "Dune", "year": 2021, "ratingKey": "5"})
+    )
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not bot.processed_media
+    assert bot._claim_announcement(("movie", "Dune", 2021))
+
+
+@pytest.mark.asyncio
+async def test_episode_batch_shares_one_poster(bot, channel, monkeypatch):
+    """Test that episodes of one show fetch and attach the show poster once."""
+    fetched = []
+
+    async def fetch_poster(self, thumb, rating_key):
+        fetched.append(thumb)
+        return discord.File(io.BytesIO(b"jpeg"), filename=f"poster_{len(fetched)}.jpg")
+
+    monkeypatch.setattr(PlexDiscordBot, "_fetch_poster", fetch_poster)
+    for index in range(3):
+        await bot.announce_new_episode_from_webhook(dict(episode(index), grandparentThumb="/show"))
+    await bot._stop_episode_queue()
+
+    assert fetched == ["/show"]
+    assert [f.filename for f in channel.files[0]] == ["poster_1.jpg"]
+    assert {embed.thumbnail.url for embed in channel.sent[0]} == {"attachment://poster_1.jpg"}
+
+
+@pytest.mark.asyncio
+async def test_oversized_send_is_retried_without_files(bot):
+    """Test that a 413 with artwork attached is retried without the attachments."""
+    too_large = discord.HTTPException(mock.Mock(status=413, reason="Payload Too Large"), "")
+    destination = mock.Mock(id=1)
+    destination.send = mock.AsyncMock(side_effect=[too_large, None])
+    embed = discord.Embed(title="Dune").set_thumbnail(url="attachment://poster_5.jpg")
+    poster = discord.File(io.BytesIO(b"jpeg"), filename="poster_5.jpg")
+
+    await bot._send_embeds(destination, [embed], [poster])
+
+    assert destination.send.await_args.kwargs["files"] == []
+    assert embed.thumbnail.url is None
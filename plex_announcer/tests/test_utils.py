@@ -2,7 +2,14 @@
 
 import pytest
 
+from plex_announcer.utils.config import Config
+from plex_announcer.utils.embed_builder import EmbedBuilder
 from plex_announcer.utils.formatting import format_duration
+from plex_announcer.utils.media_storage import (
+    append_processed_media,
+    load_processed_media,
+    save_processed_media,
+)
 
 
 def test_format_duration():
@@ -18,3 +25,111 @@ def test_format_duration():
     # 45 minutes in milliseconds
     milliseconds = 45 * 60 * 1000
     assert format_duration(milliseconds) == "0h 45m"
+
+
+def test_processed_media_round_trip(tmp_path):
+    """Test saving and loading processed media rating keys."""
+    data_file = str(tmp_path / "data" / "processed_media.json")
+
+    # Missing file loads as empty
+    assert not load_processed_media(data_file)
+
+    save_processed_media([1337, 1, 42], data_file)
+    assert list(load_processed_media(data_file)) == [1337, 1, 42]
+
+    # Only the most recent keys are kept when a cap is given
+    assert list(load_processed_media(data_file, max_entries=2)) == [1, 42]
+
+
+def test_processed_media_append_log(tmp_path):
+    """Test that appended keys are replayed on load and folded in by a full save."""
+    data_file = str(tmp_path / "data" / "processed_media.json")
+
+    # The log works before anything has been saved
+    append_processed_media([7, 8], data_file)
+    assert list(load_processed_media(data_file)) == [7, 8]
+
+    save_processed_media([1, 7], data_file)
+    append_processed_media([1, 9], data_file)
+    assert list(load_processed_media(data_file)) == [7, 1, 9]
+    assert list(load_processed_media(data_file, max_entries=2)) == [1, 9]
+
+    save_processed_media([7, 1, 9], data_file)
+    assert not (tmp_path / "data" / "processed_media.json.wal").exists()
+    assert list(load_processed_media(data_file)) == [7, 1, 9]
+
+
+def test_processed_media_log_skips_invalid_lines(tmp_path):
+    """Test that a corrupt log line is skipped without losing the other keys."""
+    data_file = str(tmp_path / "processed_media.json")
+    save_processed_media([1, 2], data_file)
+    (tmp_path / "processed_media.json.wal").write_text("3\nnot-a-key\n4\n5")
+
+    assert list(load_processed_media(data_file)) == [1, 2, 3, 4, 5]
+
+    # A torn final line, as left by a crash mid-append
+    (tmp_path / "processed_media.json.wal").write_bytes(b"3\n4\x00\x00")
+    assert list(load_processed_media(data_file)) == [1, 2, 3]
+
+
+def test_build_movie_embed_from_webhook_data():
+    """Test building a movie embed from Plex webhook metadata."""
+    embed = EmbedBuilder.build_movie_embed(
+        {
+            "title": "Dune",
+            "year": 2021,
+            "summary": "A noble family becomes embroiled in a war.",
+            "tagline": "Fear is the mind-killer",
+            "thumb": "/library/metadata/1/thumb/1",
+            "duration": (2 * 60 * 60 + 35 * 60) * 1000,
+        }
+    )
+
+    assert embed.title == "New Movie Added: Dune (2021)"
+    assert embed.description.startswith("*Fear is the mind-killer*")
+    assert [(f.name, f.value) for f in embed.fields] == [("Duration", "2h 35m")]
+    # Server-relative Plex paths cannot be fetched by Discord
+    assert embed.thumbnail.url is None
+
+
+REQUIRED_ENV = {
+    "DISCORD_TOKEN": "token",
+    "DISCORD_MOVIE_CHANNEL_ID": "1",
+    "DISCORD_NEW_SHOWS_CHANNEL_ID": "2",
+    "DISCORD_RECENT_EPISODES_CHANNEL_ID": "3",
+    "DISCORD_BOT_DEBUG_CHANNEL_ID": "4",
+    "PLEX_BASE_URL": "http://plex:32400",
+    "PLEX_TOKEN": "plex-token",
+}
+
+
+def test_config_from_env():
+    """Test parsing configuration from an environment mapping."""
+    config = Config.from_env(
+        {
+            **REQUIRED_ENV,
+            "CHECK_INTERVAL": "600",
+            "NOTIFY_MOVIES": "false",
+            "WEBHOOK_ENABLED": "Yes",
+            "DISCORD_MOVIE_WEBHOOK_URL": "https://discord.com/api/webhooks/1/abc",
+        }
+    )
+
+    assert config.movie_channel_id == 1
+    assert config.bot_debug_channel_id == 4
+    assert config.check_interval == 600
+    assert config.notify_movies is False
+    assert config.webhook_enabled is True
+    assert config.movie_webhook_url == "https://discord.com/api/webhooks/1/abc"
+    assert config.recent_episodes_webhook_url is None
+    # Unset optional settings keep their defaults
+    assert config.tv_library == "TV Shows"
+
+
+def test_config_from_env_missing_required():
+    """Test that missing required settings are reported."""
+    env = dict(REQUIRED_ENV)
+    del env["PLEX_TOKEN"]
+
+    with pytest.raises(ValueError, match="PLEX_TOKEN"):
+        Config.from_env(env)
@@ -4,12 +4,59 @@ Configuration management for Plex Discord Announcer.
 
 import os
 from dataclasses import dataclass
-from typing import Optional
-
-
-@dataclass
+from typing import Callable, ClassVar, Mapping, Optional, Tuple
+
+# Values accepted as "on" for boolean settings
+_TRUTHY = frozenset({"1", "true", "yes", "on", "t", "y"})
+
+
+def _bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    """Read a boolean setting, falling back to the default when unset."""
+    value = env.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
+# Discord channel settings as (field name, environment variable), all required
+_CHANNEL_SETTINGS: Tuple[Tuple[str, str], ...] = (
+    ("movie_channel_id", "DISCORD_MOVIE_CHANNEL_ID"),
+    ("new_shows_channel_id", "DISCORD_NEW_SHOWS_CHANNEL_ID"),
+    ("recent_episodes_channel_id", "DISCORD_RECENT_EPISODES_CHANNEL_ID"),
+    ("bot_debug_channel_id", "DISCORD_BOT_DEBUG_CHANNEL_ID"),
+)
+
+# Optional settings as (field name, environment variable, parser), applied only when set
+_OPTIONAL_SETTINGS: Tuple[Tuple[str, str, Callable[[str], object]], ...] = (
+    ("check_interval", "CHECK_INTERVAL", int),
+    ("movie_library", "PLEX_MOVIE_LIBRARY", str),
+    ("tv_library", "PLEX_TV_LIBRARY", str),
+    ("log_level", "LOGGING_LEVEL", str),
+    ("recent_episode_days", "RECENT_EPISODE_DAYS", int),
+    ("plex_connect_retry", "PLEX_CONNECT_RETRY", int),
+    ("webhook_port", "WEBHOOK_PORT", int),
+    ("webhook_host", "WEBHOOK_HOST", str),
+    ("data_file", "DATA_FILE", str),
+    ("movie_webhook_url", "DISCORD_MOVIE_WEBHOOK_URL", str),
+    ("new_shows_webhook_url", "DISCORD_NEW_SHOWS_WEBHOOK_URL", str),
+    ("recent_episodes_webhook_url", "DISCORD_RECENT_EPISODES_WEBHOOK_URL", str),
+)
+
+
+@dataclass(frozen=True)
 class Config:
-    """Configuration settings for the Plex Discord Announcer."""
+    """Configuration settings for the Plex Discord Announcer, parsed once at startup."""
+
+    # Environment variables that must be set for the bot to start
+    REQUIRED_KEYS: ClassVar[Tuple[str, ...]] = (
+        "DISCORD_TOKEN",
+        "DISCORD_MOVIE_CHANNEL_ID",
+        "DISCORD_NEW_SHOWS_CHANNEL_ID",
+        "DISCORD_RECENT_EPISODES_CHANNEL_ID",
+        "DISCORD_BOT_DEBUG_CHANNEL_ID",
+        "PLEX_BASE_URL",
+        "PLEX_TOKEN",
+    )
 
     # Required settings
     discord_token: str
@@ -33,75 +80,46 @@ class Config:
     webhook_enabled: bool = False
     webhook_port: int = 10000
     webhook_host: str = "0.0.0.0"
+    data_file: str = "data/processed_media.json"
+
+    # Discord webhooks to post announcements through instead of the bot's channel
+    movie_webhook_url: Optional[str] = None
+    new_shows_webhook_url: Optional[str] = None
+    recent_episodes_webhook_url: Optional[str] = None
 
     @classmethod
-    def from_env(cls) -> "Config":
-        """Create a Config instance from environment variables."""
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Config":
+        """Create a Config instance from environment variables.
+
+        Args:
+            env: Mapping to read settings from. Defaults to a snapshot of os.environ.
+        """
+        # Snapshot the environment once so every setting is a plain dict lookup
+        env = dict(os.environ) if env is None else env
+
         # Validate required environment variables
-        required_vars = [
-            "DISCORD_TOKEN",
-            "DISCORD_MOVIE_CHANNEL_ID",
-            "DISCORD_NEW_SHOWS_CHANNEL_ID",
-            "DISCORD_RECENT_EPISODES_CHANNEL_ID",
-            "DISCORD_BOT_DEBUG_CHANNEL_ID",
-            "PLEX_BASE_URL",
-            "PLEX_TOKEN",
-        ]
-        missing = [var for var in required_vars if not os.getenv(var)]
+        missing = tuple(var for var in cls.REQUIRED_KEYS if not env.get(var))
         if missing:
             raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
 
-        # Parse channel IDs
-        movie_channel_id = int(os.getenv("DISCORD_MOVIE_CHANNEL_ID"))
-        new_shows_channel_id = int(os.getenv("DISCORD_NEW_SHOWS_CHANNEL_ID"))
-        recent_episodes_channel_id = int(os.getenv("DISCORD_RECENT_EPISODES_CHANNEL_ID"))
-        bot_debug_channel_id = int(os.getenv("DISCORD_BOT_DEBUG_CHANNEL_ID"))
-
-        # Parse boolean flags
-        notify_movies = os.getenv("NOTIFY_MOVIES", "true").lower() == "true"
-        notify_new_shows = os.getenv("NOTIFY_NEW_SHOWS", "true").lower() == "true"
-        notify_recent_episodes = os.getenv("NOTIFY_RECENT_EPISODES", "true").lower() == "true"
-        webhook_enabled = os.getenv("WEBHOOK_ENABLED", "false").lower() == "true"
-
-        # Create instance with required parameters
-        instance = cls(
-            discord_token=os.getenv("DISCORD_TOKEN"),
-            movie_channel_id=movie_channel_id,
-            new_shows_channel_id=new_shows_channel_id,
-            recent_episodes_channel_id=recent_episodes_channel_id,
-            bot_debug_channel_id=bot_debug_channel_id,
-            plex_base_url=os.getenv("PLEX_BASE_URL"),
-            plex_token=os.getenv("PLEX_TOKEN"),
-            notify_movies=notify_movies,
-            notify_new_shows=notify_new_shows,
-            notify_recent_episodes=notify_recent_episodes,
-            webhook_enabled=webhook_enabled,
+        # Collect optional parameters only if they exist in environment
+        optional = {}
+        for field_name, var, parse in _OPTIONAL_SETTINGS:
+            value = env.get(var)
+            if value:
+                optional[field_name] = parse(value)
+
+        # Parse every channel ID in one pass over the channel table
+        channel_ids = {field_name: int(env[var]) for field_name, var in _CHANNEL_SETTINGS}
+
+        return cls(
+            discord_token=env["DISCORD_TOKEN"],
+            plex_base_url=env["PLEX_BASE_URL"],
+            plex_token=env["PLEX_TOKEN"],
+            notify_movies=_bool(env, "NOTIFY_MOVIES", True),
+            notify_new_shows=_bool(env, "NOTIFY_NEW_SHOWS", True),
+            notify_recent_episodes=_bool(env, "NOTIFY_RECENT_EPISODES", True),
+            webhook_enabled=_bool(env, "WEBHOOK_ENABLED", False),
+            **channel_ids,
+            **optional,
         )
-
-        # Set optional parameters only if they exist in environment
-        if os.getenv("CHECK_INTERVAL"):
-            instance.check_interval = int(os.getenv("CHECK_INTERVAL"))
-
-        if os.getenv("PLEX_MOVIE_LIBRARY"):
-            instance.movie_library = os.getenv("PLEX_MOVIE_LIBRARY")
-
-        if os.getenv("PLEX_TV_LIBRARY"):
-            instance.tv_library = os.getenv("PLEX_TV_LIBRARY")
-
-        if os.getenv("LOGGING_LEVEL"):
-            instance.log_level = os.getenv("LOGGING_LEVEL")
-
-        if os.getenv("RECENT_EPISODE_DAYS"):
-            instance.recent_episode_days = int(os.getenv("RECENT_EPISODE_DAYS"))
-
-        if os.getenv("PLEX_CONNECT_RETRY"):
-            instance.plex_connect_retry = int(os.getenv("PLEX_CONNECT_RETRY"))
-
-        # Webhook settings
-        if os.getenv("WEBHOOK_PORT"):
-            instance.webhook_port = int(os.getenv("WEBHOOK_PORT"))
-
-        if os.getenv("WEBHOOK_HOST"):
-            instance.webhook_host = os.getenv("WEBHOOK_HOST")
-
-        return instance
@@ -3,15 +3,53 @@ Utility for creating Discord embeds for Plex media.
 """
 
 import logging
-from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import discord
+from discord.utils import utcnow
 
 from plex_announcer.utils.formatting import format_duration
 
 logger = logging.getLogger("plex_discord_bot")
 
+MOVIE_COLOR = discord.Color.blue().value
+EPISODE_COLOR = discord.Color.green().value
+SHOW_COLOR = discord.Color.purple().value
+FOOTER = {"text": "Plex Media Server"}
+
+
+def _field(name: str, value: Any) -> Dict[str, Any]:
+    """Create an inline embed field payload."""
+    return {"name": name, "value": str(value), "inline": True}
+
+
+def _build_embed(
+    title: str,
+    description: str,
+    color: int,
+    fields: List[Dict[str, Any]],
+    thumbnail_url: Optional[str] = None,
+) -> discord.Embed:
+    """Create an embed from a complete payload in a single call."""
+    payload = {
+        "title": title,
+        "description": description,
+        "color": color,
+        "timestamp": utcnow().isoformat(),
+        "fields": fields,
+        "footer": FOOTER,
+    }
+    if thumbnail_url:
+        payload["thumbnail"] = {"url": thumbnail_url}
+    return discord.Embed.from_dict(payload)
+
+
+def _public_url(url: Optional[str]) -> Optional[str]:
+    """Return the URL only if Discord can fetch it (webhook thumbs are server-relative)."""
+    if url and url.startswith(("http://", "https://")):
+        return url
+    return None
+
 
 class EmbedBuilder:
     """Builder for Discord embeds for Plex media."""
@@ -23,30 +61,21 @@ class EmbedBuilder:
         if movie.get("year"):
             title += f" ({movie['year']})"
 
-        description = movie.get("summary", "No summary available")
-
-        embed = discord.Embed(
-            title=title,
-            description=description,
-            color=discord.Color.blue(),
-            timestamp=datetime.now(),
-        )
-
-        if movie.get("poster_url"):
-            embed.set_thumbnail(url=movie["poster_url"])
-
+        fields = []
         if movie.get("content_rating"):
-            embed.add_field(name="Rating", value=movie["content_rating"], inline=True)
-
+            fields.append(_field("Rating", movie["content_rating"]))
         if movie.get("duration"):
-            embed.add_field(name="Duration", value=format_duration(movie["duration"]), inline=True)
-
+            fields.append(_field("Duration", format_duration(movie["duration"])))
         if movie.get("genres"):
-            embed.add_field(name="Genres", value=", ".join(movie["genres"]), inline=True)
-
-        embed.set_footer(text="Plex Media Server")
-
-        return embed
+            fields.append(_field("Genres", ", ".join(movie["genres"])))
+
+        return _build_embed(
+            title,
+            movie.get("summary", "No summary available"),
+            MOVIE_COLOR,
+            fields,
+            movie.get("poster_url"),
+        )
 
     @staticmethod
     def create_episode_embed(episode: Dict[str, Any]) -> discord.Embed:
@@ -65,29 +94,72 @@ class EmbedBuilder:
         summary = episode.get("summary", "No summary available")
         description = f"{episode_info}\n\n{summary}"
 
-        embed = discord.Embed(
-            title=title,
-            description=description,
-            color=discord.Color.green(),
-            timestamp=datetime.now(),
+        fields = []
+        if episode.get("content_rating"):
+            fields.append(_field("Rating", episode["content_rating"]))
+        if episode.get("duration"):
+            fields.append(_field("Duration", format_duration(episode["duration"])))
+        if episode.get("air_date"):
+            fields.append(_field("Air Date", episode["air_date"]))
+
+        return _build_embed(
+            title,
+            description,
+            EPISODE_COLOR,
+            fields,
+            episode.get("poster_url") or episode.get("show_poster_url"),
         )
 
-        if episode.get("poster_url"):
-            embed.set_thumbnail(url=episode["poster_url"])
-        elif episode.get("show_poster_url"):
-            embed.set_thumbnail(url=episode["show_poster_url"])
+    @staticmethod
+    def build_movie_embed(movie: Dict[str, Any]) -> discord.Embed:
+        """Create a Discord embed for a movie from Plex webhook data."""
+        title = f"New Movie Added: {movie['title']}"
+        if movie.get("year"):
+            title += f" ({movie['year']})"
+
+        description = movie.get("summary") or "No summary available"
+        if movie.get("tagline"):
+            description = f"*{movie['tagline']}*\n\n{description}"
 
-        if episode.get("content_rating"):
-            embed.add_field(name="Rating", value=episode["content_rating"], inline=True)
+        fields = []
+        if movie.get("duration"):
+            fields.append(_field("Duration", format_duration(movie["duration"])))
+        if movie.get("rating"):
+            fields.append(_field("Rating", movie["rating"]))
 
-        if episode.get("duration"):
-            embed.add_field(
-                name="Duration", value=format_duration(episode["duration"]), inline=True
-            )
+        return _build_embed(
+            title, description, MOVIE_COLOR, fields, _public_url(movie.get("thumb"))
+        )
 
-        if episode.get("air_date"):
-            embed.add_field(name="Air Date", value=episode["air_date"], inline=True)
+    @staticmethod
+    def build_episode_embed(episode: Dict[str, Any]) -> discord.Embed:
+        """Create a Discord embed for a TV episode from Plex webhook data."""
+        episode_info = f"**S{episode['season']}E{episode['episode']} - {episode['title']}**"
+        summary = episode.get("summary") or "No summary available"
 
-        embed.set_footer(text="Plex Media Server")
+        fields = []
+        if episode.get("duration"):
+            fields.append(_field("Duration", format_duration(episode["duration"])))
+
+        return _build_embed(
+            f"New Episode Added: {episode['show_title']}",
+            f"{episode_info}\n\n{summary}",
+            EPISODE_COLOR,
+            fields,
+            _public_url(episode.get("thumb")) or _public_url(episode.get("grandparentThumb")),
+        )
 
-        return embed
+    @staticmethod
+    def build_show_embed(show: Dict[str, Any]) -> discord.Embed:
+        """Create a Discord embed for a new TV show from Plex webhook data."""
+        title = f"New Show Added: {show['title']}"
+        if show.get("year"):
+            title += f" ({show['year']})"
+
+        return _build_embed(
+            title,
+            show.get("summary") or "No summary available",
+            SHOW_COLOR,
+            [],
+            _public_url(show.get("thumb")),
+        )
@@ -2,6 +2,8 @@
 
 import asyncio
 import os
+import random
+import time
 from datetime import datetime
 
 import discord
@@ -11,6 +13,9 @@ from plex_announcer.utils.logging_config import configure_logging
 
 logger = configure_logging(log_file="healthcheck.log")
 
+# Upper bound in seconds for the backoff between Plex connection attempts
+MAX_RETRY_BACKOFF = 30
+
 
 async def check_discord_connection(token: str) -> bool:
     """
@@ -44,20 +49,48 @@ async def check_discord_connection(token: str) -> bool:
         return False
 
 
-def check_plex_connection(url: str, token: str) -> bool:
-    """Check if we can connect to Plex."""
+def check_plex_connection(url: str, token: str, retries: int = 3, deadline: float = 10.0) -> bool:
+    """
+    Check if we can connect to Plex.
+
+    Failed attempts are retried with exponential backoff and full jitter, so
+    probes from several containers do not reconnect in lockstep while Plex
+    restarts. No attempt starts once the deadline has passed.
+
+    Args:
+        url (str): Plex server base URL.
+        token (str): Plex authentication token.
+        retries (int): Retries after the first attempt, as for PLEX_CONNECT_RETRY.
+        deadline (float): Total seconds the check may take.
+
+    Returns:
+        bool: True if connection is successful, False otherwise.
+    """
     if not url or not token:
         logger.error("Plex URL or token not provided")
         return False
 
-    try:
-        # Connect to Plex
-        PlexServer(url, token)
-        logger.info("Successfully connected to Plex")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to connect to Plex: {e}")
-        return False
+    # The first attempt always runs, even with retries disabled
+    attempts = max(retries, 0) + 1
+    start = time.monotonic()
+    for attempt in range(1, attempts + 1):
+        remaining = deadline - (time.monotonic() - start)
+        if remaining <= 0:
+            break
+
+        try:
+            # Connect to Plex
+            PlexServer(url, token, timeout=remaining)
+            logger.info("Successfully connected to Plex")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to Plex (attempt {attempt}/{attempts}): {e}")
+
+        if attempt < attempts:
+            backoff = min(2**attempt, MAX_RETRY_BACKOFF) * random.random()
+            time.sleep(max(0.0, min(backoff, deadline - (time.monotonic() - start))))
+
+    return False
 
 
 def check_data_file(data_file: str) -> bool:
@@ -92,12 +125,17 @@ async def run_healthcheck() -> bool:
     discord_token = os.getenv("DISCORD_TOKEN")
     plex_base_url = os.getenv("PLEX_BASE_URL", "http://localhost:32400")
     plex_token = os.getenv("PLEX_TOKEN")
-    data_file = os.getenv("DATA_FILE", "processed_media.json")
+    plex_retries = int(os.getenv("PLEX_CONNECT_RETRY", "3"))
+    data_file = os.getenv("DATA_FILE", "data/processed_media.json")
 
     logger.info("Starting healthcheck")
 
-    discord_ok = await check_discord_connection(discord_token)
-    plex_ok = check_plex_connection(plex_base_url, plex_token)
+    # PlexServer() does blocking HTTP, so run it in a worker thread alongside the Discord login
+    loop = asyncio.get_running_loop()
+    discord_ok, plex_ok = await asyncio.gather(
+        check_discord_connection(discord_token),
+        loop.run_in_executor(None, check_plex_connection, plex_base_url, plex_token, plex_retries),
+    )
     data_ok = check_data_file(data_file)
 
     all_ok = discord_ok and plex_ok and data_ok
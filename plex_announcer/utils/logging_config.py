@@ -1,14 +1,59 @@
 """Logging configuration for Plex Discord Announcer."""
 
+import atexit
+import functools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Tuple
+
+# Shared by every handler so the format string is parsed once
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+
+@functools.lru_cache(maxsize=None)
+def _build_handlers(log_file: str) -> Tuple[QueueHandler, Tuple[logging.Handler, ...]]:
+    """
+    Build the handlers for a log file once and start their background listener.
+
+    Args:
+        log_file (str): Path to the log file.
+
+    Returns:
+        Tuple[QueueHandler, Tuple[logging.Handler, ...]]: The queue handler to attach to the
+        root logger, and the console and file handlers fed by it.
+    """
+    # Create logs directory if it doesn't exist
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    # Create console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(_FORMATTER)
+
+    # Create file handler with rotation, opening the file on first write
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=5 * 1024 * 1024, backupCount=3, delay=True  # 5 MB
+    )
+    file_handler.setFormatter(_FORMATTER)
+
+    # Write records from a background thread so logging calls never block the event loop
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    return QueueHandler(log_queue), (console_handler, file_handler)
 
 
 def configure_logging(log_file="plex_announcer.log"):
     """
     Configure logging for the application.
 
+    Safe to call more than once: handlers are built once per log file and reused.
+
     Args:
         log_file (str): Path to the log file.
 
@@ -18,31 +63,19 @@ def configure_logging(log_file="plex_announcer.log"):
     log_level = os.getenv("LOGGING_LEVEL", "INFO").upper()
     numeric_level = getattr(logging, log_level, logging.INFO)
 
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    queue_handler, handlers = _build_handlers(log_file)
+    for handler in handlers:
+        handler.setLevel(numeric_level)
 
-    # Configure root logger
+    # Configure package logger
     logger = logging.getLogger("plex_announcer")
     logger.setLevel(numeric_level)
 
-    # Create formatters
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(numeric_level)
-    console_handler.setFormatter(formatter)
-
-    # Create file handler with rotation
-    file_handler = RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=3)  # 5 MB
-    file_handler.setLevel(numeric_level)
-    file_handler.setFormatter(formatter)
-
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Attach the queue to the root logger so every module logger is captured
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    if queue_handler not in root_logger.handlers:
+        root_logger.addHandler(queue_handler)
 
     # Silence noisy libraries
     logging.getLogger("discord").setLevel(logging.WARNING)
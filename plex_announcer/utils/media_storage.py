@@ -0,0 +1,109 @@
+"""Persistence helpers for media the announcer has already processed."""
+
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+logger = logging.getLogger("plex_discord_bot")
+
+
+def _wal_file(data_file: str) -> str:
+    """Return the path of the append-only log kept next to the processed media file."""
+    return f"{data_file}.wal"
+
+
+def _open_for_write(path: str, mode: str):
+    """Open a file for writing, creating its directory on first use."""
+    try:
+        return open(path, mode)
+    except FileNotFoundError:
+        # Only the first write needs the data directory created
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return open(path, mode)
+
+
+def load_processed_media(
+    data_file: str, max_entries: Optional[int] = None
+) -> "OrderedDict[int, None]":
+    """
+    Load the already announced Plex rating keys, oldest first.
+
+    Keys appended to the log since the last full save are replayed on top of the saved list.
+
+    Args:
+        data_file (str): Path to the processed media JSON file.
+        max_entries (Optional[int]): Keep only this many of the most recent keys.
+
+    Returns:
+        OrderedDict[int, None]: Rating keys that have already been announced, in the order
+        they were recorded.
+    """
+    processed_media: "OrderedDict[int, None]" = OrderedDict()
+    try:
+        if os.path.exists(data_file):
+            with open(data_file, "r") as f:
+                processed_media = OrderedDict.fromkeys(int(key) for key in json.load(f))
+    except (OSError, ValueError, TypeError) as e:
+        logger.error("Error loading processed media from %s: %s", data_file, e)
+
+    # Replayed separately, so a torn line from a crash mid-append doesn't lose the saved keys
+    wal_file = _wal_file(data_file)
+    try:
+        if os.path.exists(wal_file):
+            with open(wal_file, "r") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        key = int(line)
+                    except ValueError:
+                        logger.warning(
+                            "Skipping invalid line %d in %s: %r", line_number, wal_file, line
+                        )
+                        continue
+                    processed_media[key] = None
+                    processed_media.move_to_end(key)
+    except OSError as e:
+        logger.error("Error replaying processed media log %s: %s", wal_file, e)
+
+    if max_entries is not None:
+        while len(processed_media) > max_entries:
+            processed_media.popitem(last=False)
+    return processed_media
+
+
+def save_processed_media(processed_media: Iterable[int], data_file: str) -> None:
+    """
+    Save the already announced Plex rating keys, replacing the file and clearing the log.
+
+    Args:
+        processed_media (Iterable[int]): Rating keys that have been announced, oldest first.
+        data_file (str): Path to the processed media JSON file.
+    """
+    # Write to a temporary file and swap it in so a crash never leaves a truncated file
+    tmp_file = f"{data_file}.tmp"
+    with _open_for_write(tmp_file, "w") as f:
+        json.dump(list(processed_media), f, separators=(",", ":"))
+    os.replace(tmp_file, data_file)
+
+    # Everything in the log is part of the saved file now
+    try:
+        os.remove(_wal_file(data_file))
+    except FileNotFoundError:
+        pass
+
+
+def append_processed_media(rating_keys: Iterable[int], data_file: str) -> None:
+    """
+    Append newly announced Plex rating keys to the log next to the processed media file.
+
+    Args:
+        rating_keys (Iterable[int]): Rating keys announced since the last write, oldest first.
+        data_file (str): Path to the processed media JSON file.
+    """
+    lines = "".join(f"{key}\n" for key in rating_keys)
+    if lines:
+        with _open_for_write(_wal_file(data_file), "a") as f:
+            f.write(lines)
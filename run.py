@@ -3,9 +3,7 @@
 Entry point script for running the Plex Discord Announcer.
 """
 
-import asyncio
-
-from plex_announcer.cli import main
+from plex_announcer.cli import run
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()